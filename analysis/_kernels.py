@@ -0,0 +1,246 @@
+"""
+Module _kernels - Boucles numériques des indicateurs
+
+Les récurrences (RSI de Wilder, ...) ne se vectorisent pas avec NumPy.
+Elles sont compilées avec numba quand il est installé, sinon elles
+s'exécutent en Python pur (suffisant pour quelques mois d'historique).
+
+cache=True conserve le code compilé sur disque entre deux lancements.
+Pas de fastmath: il autorise le compilateur à supposer qu'aucun NaN
+n'apparaît, or les prix de clôture peuvent en contenir (historiques
+incomplets). Sans fastmath, un NaN se propage au résultat.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba est optionnel
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur neutre"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """Formule du RSI à partir des moyennes des gains et des pertes"""
+    # Pas de division par 0
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def rsi_wilder(close: np.ndarray, period: int):
+    """
+    RSI avec les moyennes de Wilder (RMA, alpha = 1/period)
+
+    La première moyenne est la moyenne simple des `period` premières
+    variations, puis: moyenne = (moyenne * (period - 1) + valeur) / period.
+    Les variations sont calculées à la volée, sans tableau intermédiaire.
+    Un NaN dans les prix donne un RSI NaN (et des moyennes NaN): il est
+    testé explicitement, les comparaisons d > 0 / d < 0 le compteraient
+    sinon comme une variation nulle.
+
+    Args:
+        close (ndarray): Prix de clôture (len > period)
+        period (int): Période du lissage
+
+    Returns:
+        tuple: (RSI, moyenne des gains, moyenne des pertes)
+    """
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = close[i] - close[i - 1]
+        if np.isnan(d):
+            return np.nan, np.nan, np.nan
+        if d > 0:
+            avg_gain += d
+        else:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, close.shape[0]):
+        d = close[i] - close[i - 1]
+        if np.isnan(d):
+            return np.nan, np.nan, np.nan
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    return rsi_from_averages(avg_gain, avg_loss), avg_gain, avg_loss
+
+
+@njit(cache=True, parallel=True)
+def rsi_wilder_batch(closes: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI de plusieurs séries en un seul appel (une ligne par action)
+
+    Les lignes sont traitées en parallèle (prange) quand numba est installé.
+
+    Args:
+        closes (ndarray): Tableau 2-D (actions x jours) de prix de clôture
+        period (int): Période du lissage
+
+    Returns:
+        ndarray: RSI de chaque ligne (NaN si pas assez de données)
+    """
+    n_series = closes.shape[0]
+    out = np.empty(n_series)
+    for k in prange(n_series):
+        if closes.shape[1] <= period:
+            out[k] = np.nan
+        else:
+            out[k] = rsi_wilder(closes[k], period)[0]
+    return out
+
+
+@njit(cache=True)
+def rolling_mean(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Moyenne mobile simple complète, par somme glissante en O(n)
+    
+    Chaque prix est ajouté une fois et retiré une fois de la somme (au lieu
+    de `window` additions par jour). Les `window - 1` premières valeurs
+    valent NaN, comme pandas rolling; une fenêtre contenant un NaN donne NaN.
+    
+    Args:
+        close (ndarray): Prix de clôture
+        window (int): Nombre de jours (>= 1)
+    
+    Returns:
+        ndarray: Moyenne mobile, même longueur que close
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    n_nan = 0
+    for i in range(n):
+        x = close[i]
+        if np.isnan(x):
+            n_nan += 1
+        else:
+            total += x
+        if i >= window:
+            old = close[i - window]
+            if np.isnan(old):
+                n_nan -= 1
+            else:
+                total -= old
+        if i >= window - 1 and n_nan == 0:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True)
+def rolling_mean_last(close: np.ndarray, window: int) -> float:
+    """
+    Dernière valeur de la moyenne mobile simple, sans calculer toute la série
+
+    Args:
+        close (ndarray): Prix de clôture (len >= window)
+        window (int): Nombre de jours
+
+    Returns:
+        float: Moyenne des `window` derniers prix
+    """
+    total = 0.0
+    n = close.shape[0]
+    for i in range(n - window, n):
+        total += close[i]
+    return total / window
+
+
+@njit(cache=True)
+def price_stats(prices: np.ndarray):
+    """
+    Moyenne, minimum, maximum et écart-type en un seul parcours
+
+    L'écart-type (échantillon, ddof=1 comme pandas) est obtenu avec
+    l'algorithme de Welford, plus stable que la somme des carrés.
+
+    Args:
+        prices (ndarray): Prix
+
+    Returns:
+        tuple: (moyenne, min, max, écart-type)
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    lo = np.inf
+    hi = -np.inf
+    for i in range(prices.shape[0]):
+        x = prices[i]
+        if np.isnan(x):  # Valeurs manquantes ignorées, comme pandas
+            continue
+        n += 1
+        if x < lo:
+            lo = x
+        if x > hi:
+            hi = x
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return mean, lo, hi, std
+
+
+@njit(cache=True)
+def welford_volatility(close: np.ndarray) -> float:
+    """
+    Écart-type (ddof=1) des variations quotidiennes en %, en un seul parcours
+
+    Les variations close[i] / close[i-1] - 1 sont calculées à la volée
+    (algorithme de Welford): aucun tableau intermédiaire n'est alloué.
+
+    Args:
+        close (ndarray): Prix de clôture
+
+    Returns:
+        float: Volatilité en %, NaN si moins de 2 variations
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, close.shape[0]):
+        prev = close[i - 1]
+        if prev == 0 or np.isnan(prev) or np.isnan(close[i]):
+            continue
+        r = (close[i] / prev - 1.0) * 100.0
+        n += 1
+        delta = r - mean
+        mean += delta / n
+        m2 += delta * (r - mean)
+
+    if n < 2:
+        return np.nan
+    return np.sqrt(m2 / (n - 1))
+
+
+def warm_up():
+    """
+    Compile tous les noyaux sur un petit tableau
+
+    À appeler une fois au démarrage d'une application longue (Streamlit):
+    le premier utilisateur n'attend pas la compilation numba.
+    """
+    close = np.linspace(1.0, 2.0, 30)
+    rsi_wilder(close, 14)
+    rsi_wilder_batch(close.reshape(1, -1), 14)
+    rolling_mean(close, 20)
+    rolling_mean_last(close, 20)
+    price_stats(close)
+    welford_volatility(close)
@@ -0,0 +1,76 @@
+"""
+Module bundle - Résultats d'analyse regroupés par action
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from analysis.statistics import Analyzer
+
+
+@dataclass
+class SymbolBundle:
+    """
+    Historique et indicateurs d'une action, calculés une seule fois
+
+    Partagé par les graphiques et par les sections du rapport, qui lisent
+    les valeurs au lieu de recréer Analyzer / TechnicalIndicators.
+
+    Attributes:
+        symbol (str): Symbole boursier
+        df (DataFrame): Historique (Date, Open, High, Low, Close, Volume)
+        closes (ndarray): Prix de clôture en float64
+        window (int): Nombre de jours de la moyenne mobile
+        ma (Series): Moyenne mobile sur `window` jours
+        stats (dict): Statistiques (prix_moyen, prix_min, prix_max, ecart_type)
+        volatility (float): Volatilité en %
+        trend (str): Tendance (HAUSSE, BAISSE, STABLE ou INCONNU)
+        rsi (float): RSI, None si pas assez de données
+        signal (str): Signal de trading basé sur le RSI
+    """
+    symbol: str
+    df: pd.DataFrame
+    closes: np.ndarray
+    window: int
+    ma: pd.Series
+    stats: dict
+    volatility: Optional[float]
+    trend: str
+    rsi: Optional[float]
+    signal: str
+
+
+def build_bundle(symbol: str, hist: pd.DataFrame,
+                 window: int = 20, rsi_period: int = 14) -> Optional[SymbolBundle]:
+    """
+    Calcule en une fois tous les indicateurs d'une action
+
+    Args:
+        symbol (str): Symbole boursier
+        hist (DataFrame): Historique de l'action
+        window (int): Nombre de jours de la moyenne mobile (défaut: 20)
+        rsi_period (int): Nombre de jours du RSI (défaut: 14)
+
+    Returns:
+        SymbolBundle: Résultats, ou None si l'historique est vide
+    """
+    if hist is None or hist.empty:
+        return None
+
+    closes = hist['Close'].to_numpy(dtype=np.float64)
+    results = Analyzer(hist, closes_np=closes).compute_all(window, rsi_period)
+
+    return SymbolBundle(
+        symbol=symbol,
+        df=hist,
+        closes=closes,
+        window=window,
+        ma=results['ma'],
+        stats=results['stats'],
+        volatility=results['volatility'],
+        trend=results['trend'],
+        rsi=results['rsi'],
+        signal=results['signal'],
+    )
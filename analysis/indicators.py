@@ -1,10 +1,15 @@
 """
 Module TechnicalIndicators - Indicateurs techniques
 """
+import logging
 import pandas as pd
 import numpy as np
 from typing import Optional
 
+from analysis._kernels import rsi_from_averages, rsi_wilder
+
+logger = logging.getLogger(__name__)
+
 
 class TechnicalIndicators:
     """
@@ -16,19 +21,50 @@ class TechnicalIndicators:
     - Signal de trading basique
     """
     
-    def __init__(self, data: Optional[pd.DataFrame] = None):
+    def __init__(self, data: Optional[pd.DataFrame] = None,
+                 closes_np: Optional[np.ndarray] = None):
         """
         Initialise TechnicalIndicators
         
         Args:
             data (DataFrame): Données historiques (Date, Close, etc.)
+            closes_np (ndarray, optional): Prix de clôture déjà extraits en NumPy
+                                           (partagés avec Analyzer)
         """
-        self.data = data
-        print("TechnicalIndicators initialisé")
+        self.set_data(data, closes_np)
+        logger.debug("TechnicalIndicators initialisé")
     
-    def set_data(self, data: pd.DataFrame):
-        """Met à jour les données"""
+    def set_data(self, data: Optional[pd.DataFrame],
+                 closes_np: Optional[np.ndarray] = None):
+        """
+        Met à jour les données
+        
+        Les prix de clôture sont extraits une seule fois en tableau NumPy
+        contigu (self._close), réutilisé par toutes les méthodes de calcul.
+        Si closes_np est fourni, il est utilisé tel quel (sans copie s'il est
+        déjà contigu en float64) au lieu d'être relu dans le DataFrame.
+        """
         self.data = data
+        if closes_np is not None and len(closes_np) > 0:
+            self._close: Optional[np.ndarray] = np.ascontiguousarray(closes_np, dtype=np.float64)
+        elif data is None or data.empty:
+            self._close = None
+        else:
+            self._close = np.ascontiguousarray(data['Close'].to_numpy(dtype=np.float64))
+        self._reset_rsi_state()
+    
+    def _reset_rsi_state(self):
+        """Oublie l'état du RSI (moyennes de Wilder) calculé sur les anciennes données"""
+        self._rsi_period: Optional[int] = None
+        self._avg_gain: Optional[float] = None
+        self._avg_loss: Optional[float] = None
+        self._prev_close: Optional[float] = None
+        self._rsi: Optional[float] = None
+    
+    @staticmethod
+    def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+        """Formule du RSI à partir des moyennes des gains et des pertes"""
+        return float(rsi_from_averages(avg_gain, avg_loss))
     
     def calculate_rsi(self, period: int = 14) -> Optional[float]:
         """
@@ -39,66 +75,125 @@ class TechnicalIndicators:
         - RSI < 30: Peut-être pas cher (survendu)
         - RSI entre 30-70: Normal
         
+        Les gains et pertes sont lissés avec la méthode de Wilder
+        (comme TradingView / TA-Lib). L'état du lissage est conservé
+        pour pouvoir ensuite mettre à jour le RSI avec update().
+        
         Args:
             period (int): Nombre de jours (défaut: 14)
         
         Returns:
             float: Valeur du RSI (0-100)
         """
-        if self.data is None or self.data.empty:
-            print("Pas de données")
+        if self._close is None:
+            logger.warning("Pas de données")
             return None
         
-        # Calculer les variations
-        delta = self.data['Close'].diff()
+        close = self._close
         
-        # Séparer les hausses et les baisses
-        gains = delta.where(delta > 0, 0)  # Garder seulement les gains
-        losses = -delta.where(delta < 0, 0)  # Garder seulement les pertes
+        # Il faut `period` variations, donc period + 1 prix
+        if close.size <= period:
+            logger.warning("Pas assez de données pour le RSI")
+            return None
         
-        # Moyennes des gains et pertes sur N jours
-        avg_gain = gains.rolling(window=period).mean().iloc[-1]
-        avg_loss = losses.rolling(window=period).mean().iloc[-1]
+        # Moyennes de Wilder des gains et des pertes (noyau compilé)
+        rsi, avg_gain, avg_loss = rsi_wilder(close, period)
         
-        # Pas de division par 0
-        if avg_loss == 0:
-            rsi = 100
-        else:
-            # Formule du RSI
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
+        self._rsi_period = period
+        self._avg_gain = float(avg_gain)
+        self._avg_loss = float(avg_loss)
+        self._prev_close = float(close[-1])
         
-        print(f"✅ RSI calculé: {rsi:.2f}")
+        rsi = float(rsi)
+        self._rsi = rsi
+        logger.debug("RSI calculé: %.2f", rsi)
         return rsi
     
-    def get_simple_signal(self) -> str:
+    def update(self, new_close: float) -> Optional[float]:
         """
-        Génère un signal de trading simple basé sur le RSI
+        Met à jour le RSI avec un nouveau prix de clôture, en O(1)
         
-        - RSI < 30: Signal d'ACHAT (action pas chère)
-        - RSI > 70: Signal de VENTE (action chère)
-        - Sinon: ATTENDRE
+        Nécessite un premier appel à calculate_rsi() sur l'historique.
+        
+        Args:
+            new_close (float): Nouveau prix de clôture
         
         Returns:
-            str: "ACHETER", "VENDRE", ou "ATTENDRE"
+            float: Nouvelle valeur du RSI, ou None si le RSI n'a pas été initialisé
         """
-        rsi = self.calculate_rsi()
+        if self._avg_gain is None:
+            logger.warning("RSI non initialisé, appelez d'abord calculate_rsi()")
+            return None
+        
+        period = self._rsi_period
+        delta = new_close - self._prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
         
+        self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+        self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+        self._prev_close = float(new_close)
+        
+        self._rsi = self._rsi_from_averages(self._avg_gain, self._avg_loss)
+        return self._rsi
+    
+    def update_and_signal(self, new_close: float, period: int = 14) -> str:
+        """
+        Met à jour le RSI avec un nouveau prix et renvoie le signal, en O(1)
+        
+        Au premier appel, le RSI est d'abord calculé sur l'historique
+        (noyau compilé); ensuite seul l'état de Wilder est mis à jour.
+        
+        Args:
+            new_close (float): Nouveau prix de clôture
+            period (int): Nombre de jours du RSI (défaut: 14)
+        
+        Returns:
+            str: "ACHETER", "VENDRE", "ATTENDRE", ou "INCONNU"
+        """
+        if self._rsi_period != period and self.calculate_rsi(period) is None:
+            return "INCONNU"
+        
+        return self._signal_from_rsi(self.update(new_close))
+    
+    @staticmethod
+    def _signal_from_rsi(rsi: Optional[float]) -> str:
+        """Traduit une valeur de RSI en signal de trading"""
         if rsi is None:
             return "INCONNU"
         
         if rsi < 30:
             signal = "ACHETER"
-            print(f"Signal: {signal} (RSI bas = pas cher)")
+            logger.debug("Signal: %s (RSI bas = pas cher)", signal)
         elif rsi > 70:
             signal = "VENDRE"
-            print(f"Signal: {signal} (RSI haut = cher)")
+            logger.debug("Signal: %s (RSI haut = cher)", signal)
         else:
             signal = "ATTENDRE"
-            print(f"Signal: {signal} (RSI normal)")
+            logger.debug("Signal: %s (RSI normal)", signal)
         
         return signal
     
+    def get_simple_signal(self, period: int = 14) -> str:
+        """
+        Génère un signal de trading simple basé sur le RSI
+        
+        - RSI < 30: Signal d'ACHAT (action pas chère)
+        - RSI > 70: Signal de VENTE (action chère)
+        - Sinon: ATTENDRE
+        
+        Le RSI déjà calculé (calculate_rsi ou update) est réutilisé s'il
+        l'a été sur la même période.
+        
+        Args:
+            period (int): Nombre de jours du RSI (défaut: 14)
+        
+        Returns:
+            str: "ACHETER", "VENDRE", ou "ATTENDRE"
+        """
+        rsi = self._rsi if self._rsi_period == period else self.calculate_rsi(period)
+        return self._signal_from_rsi(rsi)
+    
     def calculate_price_change(self) -> dict:
         """
         Calcule les changements de prix simples
@@ -106,16 +201,17 @@ class TechnicalIndicators:
         Returns:
             dict: Informations sur les changements de prix
         """
-        if self.data is None or self.data.empty:
-            print("Pas de données")
+        if self._close is None:
+            logger.warning("Pas de données")
             return {}
         
-        first_price = self.data['Close'].iloc[0]
-        last_price = self.data['Close'].iloc[-1]
+        # Lecture directe dans le tableau NumPy (pas d'indexeur pandas)
+        first_price = float(self._close[0])
+        last_price = float(self._close[-1])
         
-        # Variation absolue et en %
+        # Variation absolue et en % (NaN si le premier prix vaut 0)
         change = last_price - first_price
-        change_pct = (change / first_price) * 100
+        change_pct = (change / first_price) * 100 if first_price != 0 else np.nan
         
         result = {
             'prix_debut': first_price,
@@ -124,5 +220,5 @@ class TechnicalIndicators:
             'variation_pct': change_pct
         }
         
-        print(f"Variation: {change_pct:+.2f}%")
+        logger.debug("Variation: %+.2f%%", change_pct)
         return result
\ No newline at end of file
@@ -1,10 +1,16 @@
 """
 Module Analyzer - Analyse statistique des données boursières
 """
+import logging
 import numpy as np
 import pandas as pd
 from typing import Optional
 
+from analysis._kernels import price_stats, rolling_mean, rolling_mean_last, rsi_wilder, welford_volatility
+from analysis.indicators import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
 
 class Analyzer:
     """
@@ -14,19 +20,40 @@ class Analyzer:
         data (DataFrame): Données historiques à analyser
     """
     
-    def __init__(self, data: Optional[pd.DataFrame] = None):
+    def __init__(self, data: Optional[pd.DataFrame] = None,
+                 closes_np: Optional[np.ndarray] = None):
         """
         Initialise l'Analyzer
         
         Args:
             data (DataFrame): DataFrame avec colonnes Date, Open, High, Low, Close, Volume
+            closes_np (ndarray, optional): Prix de clôture déjà extraits en NumPy
+                                           (partagés avec TechnicalIndicators)
         """
-        self.data = data
-        print("Analyzer initialisé")
+        self.set_data(data, closes_np)
+        logger.debug("Analyzer initialisé")
     
-    def set_data(self, data: pd.DataFrame):
-        """Met à jour les données"""
+    def set_data(self, data: Optional[pd.DataFrame],
+                 closes_np: Optional[np.ndarray] = None):
+        """
+        Met à jour les données
+        
+        Les prix de clôture sont extraits une seule fois en tableau NumPy
+        contigu (self._close), réutilisé par toutes les méthodes de calcul.
+        Si closes_np est fourni, il est utilisé tel quel (sans copie s'il est
+        déjà contigu en float64) au lieu d'être relu dans le DataFrame.
+        """
         self.data = data
+        if closes_np is not None and len(closes_np) > 0:
+            self._close: Optional[np.ndarray] = np.ascontiguousarray(closes_np, dtype=np.float64)
+        elif data is None or data.empty:
+            self._close = None
+        else:
+            self._close = np.ascontiguousarray(data['Close'].to_numpy(dtype=np.float64))
+    
+    def _index(self) -> Optional[pd.Index]:
+        """Index des séries renvoyées (celui du DataFrame s'il y en a un)"""
+        return self.data.index if self.data is not None else None
     
     def calculate_moving_average(self, window: int = 20) -> Optional[pd.Series]:
         """
@@ -41,15 +68,31 @@ class Analyzer:
         Returns:
             Series: Moyenne mobile
         """
-        if self.data is None or self.data.empty:
-            print("Pas de données")
+        if self._close is None:
+            logger.warning("Pas de données")
             return None
         
-        # Utiliser pandas rolling pour calculer la moyenne
-        ma = self.data['Close'].rolling(window=window).mean()
-        print(f"Moyenne mobile sur {window} jours calculée")
+        # Somme glissante (noyau compilé), complétée par des NaN au début
+        # comme pandas rolling
+        ma_values = rolling_mean(self._close, window)
+        ma = pd.Series(ma_values, index=self._index(), name='Close')
+        logger.debug("Moyenne mobile sur %d jours calculée", window)
         return ma
     
+    def _last_ma(self, window: int) -> Optional[float]:
+        """
+        Dernière valeur de la moyenne mobile, sans calculer toute la série
+        
+        Args:
+            window (int): Nombre de jours
+        
+        Returns:
+            float: Moyenne des `window` derniers prix, ou None si pas assez de données
+        """
+        if self._close.size < window:
+            return None
+        return float(rolling_mean_last(self._close, window))
+    
     def calculate_daily_return(self) -> Optional[pd.Series]:
         """
         Calcule les variations quotidiennes en %
@@ -59,12 +102,18 @@ class Analyzer:
         Returns:
             Series: Variations en %
         """
-        if self.data is None or self.data.empty:
-            print("Pas de données")
+        if self._close is None:
+            logger.warning("Pas de données")
             return None
         
-        returns = self.data['Close'].pct_change() * 100
-        print("Variations quotidiennes calculées")
+        # Calcul NumPy, emballé en Series seulement au retour
+        close = self._close
+        r = np.empty_like(close)
+        r[:1] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r[1:] = (close[1:] - close[:-1]) / close[:-1] * 100.0
+        returns = pd.Series(r, index=self._index(), name='Close')
+        logger.debug("Variations quotidiennes calculées")
         return returns
     
     def calculate_volatility(self) -> Optional[float]:
@@ -76,13 +125,13 @@ class Analyzer:
         Returns:
             float: Volatilité en %
         """
-        returns = self.calculate_daily_return()
-        if returns is None:
+        if self._close is None:
+            logger.warning("Pas de données")
             return None
         
-        # Écart-type = mesure de dispersion
-        volatility = returns.std()
-        print(f"Volatilité: {volatility:.2f}%")
+        # Écart-type des variations = mesure de dispersion (un seul parcours)
+        volatility = float(welford_volatility(self._close))
+        logger.debug("Volatilité: %.2f%%", volatility)
         return volatility
     
     def get_statistics(self) -> dict:
@@ -92,20 +141,21 @@ class Analyzer:
         Returns:
             dict: Statistiques de base
         """
-        if self.data is None or self.data.empty:
-            print("Pas de données")
+        if self._close is None:
+            logger.warning("Pas de données")
             return {}
         
-        prices = self.data['Close']
+        # Un seul parcours des prix pour les 4 statistiques
+        mean, lo, hi, std = price_stats(self._close)
         
         stats = {
-            'prix_moyen': prices.mean(),
-            'prix_min': prices.min(),
-            'prix_max': prices.max(),
-            'ecart_type': prices.std()
+            'prix_moyen': float(mean),
+            'prix_min': float(lo),
+            'prix_max': float(hi),
+            'ecart_type': float(std)
         }
         
-        print("Statistiques calculées")
+        logger.debug("Statistiques calculées")
         return stats
     
     def calculate_trend(self, window: int = 20) -> str:
@@ -120,20 +170,19 @@ class Analyzer:
         Returns:
             str: "HAUSSE", "BAISSE", ou "STABLE"
         """
-        if self.data is None or self.data.empty:
-            print("Pas de données")
+        if self._close is None:
+            logger.warning("Pas de données")
             return "INCONNU"
         
-        # Prix actuel
-        current_price = self.data['Close'].iloc[-1]
-        
-        # Moyenne mobile
-        ma = self.calculate_moving_average(window)
-        if ma is None:
+        # Prix actuel comparé à la moyenne mobile (seule la dernière valeur est utile)
+        return self._trend_from_ma(self._close[-1], self._last_ma(window))
+    
+    @staticmethod
+    def _trend_from_ma(current_price: float, ma_value: Optional[float]) -> str:
+        """Tendance d'après l'écart entre le prix actuel et la moyenne mobile"""
+        if ma_value is None:
             return "INCONNU"
         
-        ma_value = ma.iloc[-1]
-        
         if current_price > ma_value * 1.02:  # 2% au-dessus
             trend = "HAUSSE"
         elif current_price < ma_value * 0.98:  # 2% en-dessous
@@ -141,5 +190,40 @@ class Analyzer:
         else:
             trend = "STABLE"
         
-        print(f"✅ Tendance: {trend}")
-        return trend
\ No newline at end of file
+        logger.debug("Tendance: %s", trend)
+        return trend
+    
+    def compute_all(self, window: int = 20, rsi_period: int = 14) -> dict:
+        """
+        Calcule en une fois tous les indicateurs affichés pour une action
+        
+        Les prix de clôture (self._close) sont lus une seule fois par
+        indicateur, sans recalcul: la tendance réutilise la moyenne mobile.
+        
+        Args:
+            window (int): Nombre de jours de la moyenne mobile (défaut: 20)
+            rsi_period (int): Nombre de jours du RSI (défaut: 14)
+        
+        Returns:
+            dict: {'ma', 'stats', 'volatility', 'trend', 'rsi', 'signal'}
+        """
+        if self._close is None:
+            logger.warning("Pas de données")
+            return {}
+        
+        close = self._close
+        ma = self.calculate_moving_average(window)
+        
+        ma_last = float(ma.iat[-1])
+        trend = self._trend_from_ma(close[-1], None if np.isnan(ma_last) else ma_last)
+        
+        rsi = float(rsi_wilder(close, rsi_period)[0]) if close.size > rsi_period else None
+        
+        return {
+            'ma': ma,
+            'stats': self.get_statistics(),
+            'volatility': self.calculate_volatility(),
+            'trend': trend,
+            'rsi': rsi,
+            'signal': TechnicalIndicators._signal_from_rsi(rsi)
+        }
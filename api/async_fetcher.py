@@ -2,13 +2,18 @@
 Module AsyncFetcher - Récupération asynchrone de données boursières
 Implémenté avec asyncio pour des performances optimales
 """
+import logging
 from typing import List, Dict, Optional
 import asyncio
+import functools
+import time
 from datetime import datetime
 from models.stock import Stock
 
 from api.data_fetcher import DataFetcher
 
+logger = logging.getLogger(__name__)
+
 
 class AsyncFetcher:
     """
@@ -17,31 +22,55 @@ class AsyncFetcher:
     Permet de récupérer plusieurs actions en parallèle
     Bien plus rapide que la version synchrone pour de nombreuses actions
     
+    Attributes:
+        max_workers (int): Nombre maximal de récupérations simultanées
     """
     
-    def __init__(self):
-        """Initialise l'AsyncFetcher"""
+    def __init__(self, max_workers: int = 10):
+        """
+        Initialise l'AsyncFetcher
+        
+        Args:
+            max_workers (int): Nombre maximal de récupérations simultanées (défaut: 10)
+        """
         self.fetcher = DataFetcher()
-        print("AsyncFetcher initialisé (mode async)")
+        self.max_workers = max_workers
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop = None
+        logger.debug("AsyncFetcher initialisé (mode async)")
+    
+    def _semaphore(self) -> asyncio.Semaphore:
+        """
+        Sémaphore lié à la boucle d'événements courante
+        
+        Un sémaphore ne peut servir que dans une seule boucle: il est recréé
+        quand l'instance est réutilisée par un autre asyncio.run().
+        """
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_workers)
+            self._sem_loop = loop
+        return self._sem
     
     async def fetch_one_stock_async(self, symbol: str) -> Optional[Stock]:
         """
         Récupère une action de manière asynchrone
         
+        Au plus max_workers récupérations s'exécutent en même temps, pour
+        ne saturer ni le pool de threads ni le serveur de Yahoo Finance.
+        
         Args:
             symbol (str): Symbole boursier
         
         Returns:
             Stock: Objet Stock créé ou None
         """
-        # Simuler un délai réseau
-        await asyncio.sleep(0.1)
-        
-        # Utiliser le fetcher démo (synchrone) mais dans un contexte async
-        stock = await asyncio.to_thread(
-            self.fetcher.create_stock_from_api,
-            symbol
-        )
+        async with self._semaphore():
+            # Utiliser le fetcher démo (synchrone) mais dans un contexte async
+            stock = await asyncio.to_thread(
+                self.fetcher.create_stock_from_api,
+                symbol
+            )
         
         return stock
     
@@ -49,8 +78,9 @@ class AsyncFetcher:
         """
         Récupère plusieurs actions en parallèle (asynchrone)
         
-        C'est ici que la magie opère : toutes les requêtes sont lancées
-        en même temps au lieu d'attendre l'une après l'autre
+        Tous les symboles sont récupérés en un seul appel groupé, exécuté
+        dans un thread pour ne pas bloquer la boucle d'événements. Les
+        symboles manquants sont ensuite récupérés individuellement.
         
         Args:
             symbols (List[str]): Liste de symboles boursiers
@@ -58,24 +88,30 @@ class AsyncFetcher:
         Returns:
             List[Stock]: Liste des stocks créés
         """
-        print(f"Récupération ASYNCHRONE de {len(symbols)} actions...")
-        start_time = datetime.now()
-        
-        # Créer toutes les tâches asynchrones
-        tasks = [self.fetch_one_stock_async(symbol) for symbol in symbols]
-        
-        # Exécuter toutes les tâches en parallèle
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Filtrer les résultats (enlever None et les erreurs)
-        stocks = [
-            result for result in results 
-            if result is not None and isinstance(result, Stock)
-        ]
-        
-        elapsed = (datetime.now() - start_time).total_seconds()
-        print(f"emps écoulé (ASYNC): {elapsed:.2f}s pour {len(stocks)}/{len(symbols)} actions")
-        print(f"   Gain de performance vs synchrone!")
+        logger.debug("Récupération ASYNCHRONE de %d actions...", len(symbols))
+        t0 = time.perf_counter()
+        
+        # Un seul appel groupé (yf.download) dans un thread, au lieu d'une
+        # requête HTTP par symbole
+        stocks = await asyncio.to_thread(self.fetcher.create_stocks_from_api, symbols)
+        
+        # Symboles absents de la réponse groupée: nouvel essai un par un,
+        # avec une concurrence limitée par le sémaphore
+        found = {stock.symbol for stock in stocks}
+        missing = [symbol for symbol in symbols if symbol.upper() not in found]
+        if missing:
+            results = await asyncio.gather(
+                *(self.fetch_one_stock_async(symbol) for symbol in missing),
+                return_exceptions=True
+            )
+            for symbol, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.error("Erreur lors de la récupération de %s: %s", symbol, result)
+                elif result is not None:
+                    stocks.append(result)
+        
+        elapsed = time.perf_counter() - t0
+        logger.info("Temps écoulé (ASYNC): %.2fs pour %d/%d actions", elapsed, len(stocks), len(symbols))
         
         return stocks
     
@@ -90,17 +126,18 @@ class AsyncFetcher:
             bool: True si au moins une action a été mise à jour
         """
         if not portfolio.stocks:
-            print("Portfolio vide, rien à mettre à jour")
+            logger.warning("Portfolio vide, rien à mettre à jour")
             return False
         
         symbols = [stock.symbol for stock in portfolio.stocks]
-        print(f"Mise à jour asynchrone du portfolio '{portfolio.name}'...")
+        logger.debug("Mise à jour asynchrone du portfolio '%s'...", portfolio.name)
         
         # Récupérer les nouvelles données
         updated_stocks = await self.fetch_multiple_stocks(symbols)
         
-        # Mettre à jour chaque stock du portfolio
+        # Mettre à jour chaque stock du portfolio (même horodatage pour tous)
         updates = 0
+        now = datetime.now()
         for updated_stock in updated_stocks:
             existing_stock = portfolio.get_stock(updated_stock.symbol)
             if existing_stock:
@@ -109,11 +146,12 @@ class AsyncFetcher:
                     opening=updated_stock.opening_price,
                     high=updated_stock.highest_price,
                     low=updated_stock.lowest_price,
-                    volume=updated_stock.volume
+                    volume=updated_stock.volume,
+                    now=now
                 )
                 updates += 1
         
-        print(f"{updates} actions mises à jour dans le portfolio")
+        logger.info("%d actions mises à jour dans le portfolio", updates)
         return updates > 0
     
     def run_async(self, coro):
@@ -130,6 +168,12 @@ class AsyncFetcher:
         return asyncio.run(coro)
 
 
+@functools.lru_cache(maxsize=1)
+def _default_async_fetcher() -> AsyncFetcher:
+    """AsyncFetcher partagé par les appels au helper (son cache est conservé)"""
+    return AsyncFetcher()
+
+
 # Fonction helper pour faciliter l'utilisation
 async def fetch_stocks_async(symbols: List[str]) -> List[Stock]:
     """
@@ -144,5 +188,5 @@ async def fetch_stocks_async(symbols: List[str]) -> List[Stock]:
     Exemple d'utilisation:
         stocks = await fetch_stocks_async(["AAPL", "GOOGL", "MSFT"])
     """
-    fetcher = AsyncFetcher()
+    fetcher = _default_async_fetcher()
     return await fetcher.fetch_multiple_stocks(symbols)
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Module FileCache - Cache disque des données téléchargées
+"""
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class FileCache:
+    """
+    Cache disque à durée de vie, conservé entre deux lancements
+
+    Chaque entrée est un fichier pickle {nom}.pkl; sa date de modification
+    sert d'horodatage pour la durée de validité.
+
+    Attributes:
+        cache_dir (str): Dossier des fichiers de cache
+        hits (int): Nombre de lectures servies par le cache
+        misses (int): Nombre de lectures absentes, expirées ou illisibles
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialise le FileCache
+
+        Args:
+            cache_dir (str): Dossier des fichiers de cache (créé à la première écriture)
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, name: str) -> str:
+        """Chemin du fichier d'une entrée"""
+        return os.path.join(self.cache_dir, f"{name}.pkl")
+
+    def get(self, name: str, ttl: float) -> Optional[Any]:
+        """
+        Lit une entrée si elle a moins de `ttl` secondes
+
+        Args:
+            name (str): Nom de l'entrée (ex: 'AAPL_3mo_1d')
+            ttl (float): Durée de validité en secondes
+
+        Returns:
+            Données en cache, ou None si absentes, expirées ou illisibles
+        """
+        path = self._path(name)
+        try:
+            if time.time() - os.path.getmtime(path) >= ttl:
+                payload = None
+            else:
+                payload = pd.read_pickle(path)
+        except FileNotFoundError:
+            payload = None
+        except Exception as e:  # Fichier corrompu ou d'une autre version de pandas
+            logger.debug("Cache disque illisible pour %s: %s", name, e)
+            payload = None
+
+        if payload is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        logger.debug("Cache disque %s: %s (%d lectures, %d manquées)",
+                     "trouvé" if payload is not None else "absent",
+                     name, self.hits, self.misses)
+        return payload
+
+    def set(self, name: str, payload: Any):
+        """
+        Enregistre une entrée
+
+        Écriture dans un fichier temporaire puis renommage: un lecteur ne
+        voit jamais de fichier partiel. Le fichier temporaire a un nom unique
+        (mkstemp), même pour deux threads qui écrivent la même entrée, et il
+        est supprimé si l'écriture échoue.
+        """
+        path = self._path(name)
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{name}.", suffix=".tmp")
+            os.close(fd)
+            pd.to_pickle(payload, tmp_path)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except Exception as e:  # Disque plein, droits, objet non picklable...
+            logger.debug("Écriture du cache disque impossible pour %s: %s", name, e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
@@ -2,12 +2,55 @@
 Module DataFetcher - Récupération de données boursières via API
 Implémenté avec yfinance
 """
-from typing import Dict, Optional, List
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Optional, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import aiohttp
+import numpy as np
 import yfinance as yf
-from datetime import datetime, timedelta
 import pandas as pd
+from api.cache import FileCache
 from models.stock import Stock
 
+logger = logging.getLogger(__name__)
+
+# Point d'accès "chart" de Yahoo Finance (utilisé par la version asynchrone)
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Colonnes de tous les historiques renvoyés (et mis en cache)
+HISTORY_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def _create_session():
+    """
+    Crée la session HTTP partagée par tous les appels yfinance
+    
+    Les versions récentes de yfinance exigent une session curl_cffi
+    (empreinte de navigateur); les anciennes acceptent requests.Session.
+    
+    Returns:
+        Session HTTP réutilisable (connexions TCP/TLS conservées)
+    """
+    try:
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        # 10 connexions conservées par hôte par défaut: davantage pour que les
+        # requêtes parallèles (fetch_multiple_stocks_threaded) ne ferment pas
+        # les connexions en trop à chaque réponse
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
 
 class DataFetcher:
     """
@@ -16,13 +59,169 @@ class DataFetcher:
     API principale: yfinance (gratuite, sans clé requise)
     
     Attributes:
-        cache (dict): Cache simple pour éviter les appels répétés
+        cache (dict): Cache à durée de vie pour éviter les appels répétés
+                      {clé: (horodatage, données)}
+        price_ttl (float): Durée de validité d'un prix en cache (secondes)
+        history_ttl (float): Durée de validité d'un historique en cache (secondes)
+        cache_dir (str): Dossier du cache disque des historiques (None = désactivé)
+        float32_history (bool): Prix des historiques en float32 (False = float64)
     """
     
-    def __init__(self):
-        """Initialise le DataFetcher"""
+    def __init__(self, price_ttl: float = 30, history_ttl: float = 3600,
+                 cache_dir: Optional[str] = "data/cache",
+                 float32_history: bool = True):
+        """
+        Initialise le DataFetcher
+        
+        Args:
+            price_ttl (float): Durée de validité d'un prix en cache (défaut: 30 s)
+            history_ttl (float): Durée de validité d'un historique en cache (défaut: 1 h)
+            cache_dir (str): Dossier du cache disque des historiques, conservé
+                             entre deux lancements (défaut: data/cache, None = désactivé)
+            float32_history (bool): Passe les prix des historiques en float32 et le
+                                    volume en int32 (défaut: True); False garde le
+                                    float64 de pandas, pour des calculs comptables
+        """
         self.cache = {}
-        print("DataFetcher initialisé avec yfinance")
+        self.price_ttl = price_ttl
+        self.history_ttl = history_ttl
+        self.cache_dir = cache_dir
+        self.float32_history = float32_history
+        self._file_cache = FileCache(cache_dir) if cache_dir is not None else None
+        self._names: Dict[str, str] = {}
+        # Un verrou par historique en cours de téléchargement
+        self._history_locks: Dict[tuple, threading.Lock] = {}
+        self._history_locks_guard = threading.Lock()
+        self._session = _create_session()
+        logger.debug("DataFetcher initialisé avec yfinance")
+    
+    def _cache_get(self, key: tuple, ttl: float) -> Optional[Any]:
+        """
+        Lit une entrée du cache si elle n'a pas expiré
+        
+        Args:
+            key (tuple): Clé du cache
+            ttl (float): Durée de validité en secondes
+        
+        Returns:
+            Données en cache, ou None si absentes ou expirées
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        timestamp, payload = entry
+        if time.monotonic() - timestamp >= ttl:
+            return None
+        return payload
+    
+    def _cache_set(self, key: tuple, payload: Any):
+        """Enregistre des données dans le cache avec l'heure actuelle"""
+        self.cache[key] = (time.monotonic(), payload)
+    
+    def _downcast_history(self, hist: pd.DataFrame) -> pd.DataFrame:
+        """
+        Passe les prix en float32 (et le volume en int32 s'il tient)
+        
+        Six chiffres significatifs suffisent pour l'analyse: l'historique
+        occupe deux fois moins de mémoire en cache. Sans effet si
+        float32_history vaut False.
+        """
+        if not self.float32_history:
+            return hist
+        for column in ('Open', 'High', 'Low', 'Close'):
+            if column in hist.columns:
+                hist[column] = hist[column].astype(np.float32, copy=False)
+        if 'Volume' in hist.columns and hist['Volume'].max() <= np.iinfo(np.int32).max:
+            hist['Volume'] = hist['Volume'].astype(np.int32, copy=False)
+        return hist
+    
+    def _normalize_history(self, hist: pd.DataFrame) -> pd.DataFrame:
+        """
+        Met un historique au format commun, quelle que soit sa source
+        
+        Ticker.history, yf.download et le point d'accès "chart" ne renvoient
+        ni les mêmes colonnes, ni le même fuseau, ni les mêmes lignes: le
+        cache ne doit pas dépendre de la source qui l'a rempli en premier.
+        
+        - colonnes HISTORY_COLUMNS seulement (sans Dividends, Stock Splits...)
+        - Date sans fuseau (datetime64[ns]), à l'heure de la place de cotation
+        - lignes sans clôture enlevées, volume manquant à 0
+        - index 0..n-1, puis types de _downcast_history
+        
+        Args:
+            hist (DataFrame): Historique brut (Date en index ou en colonne)
+        
+        Returns:
+            DataFrame: Nouvel historique, éventuellement vide
+        """
+        if 'Date' not in hist.columns:
+            # Index Date (journalier) ou Datetime (intrajournalier)
+            hist = hist.reset_index()
+            hist = hist.rename(columns={hist.columns[0]: 'Date'})
+        
+        dates = pd.to_datetime(hist['Date'])
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        dates = dates.astype('datetime64[ns]')
+        
+        out = hist.reindex(columns=HISTORY_COLUMNS)
+        out['Date'] = dates
+        out.columns.name = None
+        out = out.dropna(subset=['Close']).reset_index(drop=True)
+        for column in ('Open', 'High', 'Low', 'Close'):
+            out[column] = out[column].astype(np.float64)
+        out['Volume'] = out['Volume'].fillna(0).astype(np.int64)
+        return self._downcast_history(out)
+    
+    @staticmethod
+    def _disk_ttl(interval: str) -> float:
+        """Durée de validité du cache disque: 15 min en intrajournalier, 1 jour sinon"""
+        return 15 * 60 if interval[-1] in ('m', 'h') else 24 * 3600
+    
+    def _history_name(self, symbol: str, period: str, interval: str) -> str:
+        """Nom d'un historique dans le cache disque (les versions float64 à part)"""
+        # v2: format commun de _normalize_history (anciens fichiers ignorés)
+        name = f"{symbol}_{period}_{interval}_v2"
+        return name if self.float32_history else f"{name}_f64"
+    
+    def _history_get(self, symbol: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """
+        Cherche un historique dans le cache mémoire, puis dans le cache disque
+        
+        Returns:
+            DataFrame: Copie de l'historique en cache (l'appelant peut la
+                       modifier), ou None si absent ou expiré
+        """
+        key = ('history', symbol, period, interval)
+        hist = self._cache_get(key, self.history_ttl)
+        if hist is None and self._file_cache is not None:
+            hist = self._file_cache.get(self._history_name(symbol, period, interval),
+                                        self._disk_ttl(interval))
+            if hist is not None:
+                self._cache_set(key, hist)
+        return hist.copy() if hist is not None else None
+    
+    def _history_lock(self, symbol: str, period: str, interval: str) -> threading.Lock:
+        """Verrou propre à un historique (symbole, période, intervalle)"""
+        key = (symbol, period, interval)
+        with self._history_locks_guard:
+            lock = self._history_locks.get(key)
+            if lock is None:
+                lock = self._history_locks[key] = threading.Lock()
+            return lock
+    
+    def _history_set(self, symbol: str, period: str, interval: str,
+                     hist: pd.DataFrame) -> pd.DataFrame:
+        """
+        Enregistre un historique normalisé dans le cache mémoire et dans le cache disque
+        
+        Returns:
+            DataFrame: Copie pour l'appelant (le cache garde son propre objet)
+        """
+        self._cache_set(('history', symbol, period, interval), hist)
+        if self._file_cache is not None:
+            self._file_cache.set(self._history_name(symbol, period, interval), hist)
+        return hist.copy()
     
     def fetch_current_price(self, symbol: str) -> Optional[Dict]:
         """
@@ -44,35 +243,175 @@ class DataFetcher:
                     'previous_close': float
                 }
         """
+        key = ('price', symbol.upper())
+        cached = self._cache_get(key, self.price_ttl)
+        if cached is not None:
+            return cached
+        
         try:
-            print(f"Récupération des données pour {symbol}...")
+            logger.debug("Récupération des données pour %s...", symbol)
             
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            # fast_info: seulement les champs de prix (ticker.info télécharge
+            # tout le profil de l'entreprise, beaucoup plus lent)
+            ticker = yf.Ticker(symbol, session=self._session)
+            fi = ticker.fast_info
+            current_price = fi['lastPrice']
             
             # Vérifier si le symbole est valide
-            if not info or 'currentPrice' not in info:
-                print(f"Symbole {symbol} invalide ou données indisponibles")
+            if current_price is None or pd.isna(current_price):
+                logger.warning("Symbole %s invalide ou données indisponibles", symbol)
                 return None
             
             data = {
                 'symbol': symbol.upper(),
-                'name': info.get('longName', info.get('shortName', symbol)),
-                'current_price': info.get('currentPrice', info.get('regularMarketPrice')),
-                'open': info.get('open', info.get('regularMarketOpen')),
-                'high': info.get('dayHigh', info.get('regularMarketDayHigh')),
-                'low': info.get('dayLow', info.get('regularMarketDayLow')),
-                'volume': info.get('volume', info.get('regularMarketVolume', 0)),
-                'previous_close': info.get('previousClose', info.get('regularMarketPreviousClose'))
+                'name': self._company_name(ticker, symbol),
+                'current_price': float(current_price),
+                'open': fi['open'],
+                'high': fi['dayHigh'],
+                'low': fi['dayLow'],
+                'volume': int(fi['lastVolume'] or 0),
+                'previous_close': fi['previousClose']
             }
             
-            print(f"Données récupérées pour {symbol}: ${data['current_price']:.2f}")
+            logger.debug("Données récupérées pour %s: $%.2f", symbol, data['current_price'])
+            self._cache_set(key, data)
             return data
             
         except Exception as e:
-            print(f"Erreur lors de la récupération de {symbol}: {e}")
+            logger.error("Erreur lors de la récupération de %s: %s", symbol, e)
             return None
     
+    def _company_name(self, ticker, symbol: str) -> str:
+        """
+        Nom de l'entreprise, sans passer par ticker.info
+        
+        Les métadonnées de l'historique (déjà chargées par fast_info)
+        contiennent le nom; il est mémorisé dans self._names.
+        
+        Args:
+            ticker: Objet yf.Ticker
+            symbol (str): Symbole boursier
+        
+        Returns:
+            str: Nom de l'entreprise, ou le symbole si inconnu
+        """
+        key = symbol.upper()
+        if key not in self._names:
+            try:
+                metadata = ticker.history_metadata or {}
+            except Exception:
+                metadata = {}
+            name = metadata.get('longName') or metadata.get('shortName')
+            if not name:
+                return symbol
+            self._names[key] = name
+        return self._names[key]
+    
+    def fetch_many_current(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Récupère le prix actuel de plusieurs actions en un seul appel yfinance
+        
+        yf.download regroupe les symboles (au lieu d'un Ticker par action);
+        seuls les symboles absents du cache sont demandés. Le nom de
+        l'entreprise n'est pas fourni par ce point d'accès: le nom déjà
+        connu est réutilisé, sinon le symbole est utilisé à la place.
+        
+        Ces résultats sont mis en cache sous leur propre clé ('batch_price'):
+        fetch_current_price ne renvoie donc jamais le symbole comme nom.
+        Un symbole dont la dernière séance est incomplète (NaN) est ignoré.
+        
+        Args:
+            symbols (List[str]): Liste de symboles boursiers
+        
+        Returns:
+            dict: {symbole: données} au même format que fetch_current_price,
+                  seuls les symboles valides sont présents
+        """
+        symbols = [symbol.upper() for symbol in symbols]
+        
+        # Servir depuis le cache ce qui est encore valide
+        results = {}
+        for symbol in symbols:
+            cached = (self._cache_get(('price', symbol), self.price_ttl)
+                      or self._cache_get(('batch_price', symbol), self.price_ttl))
+            if cached is not None:
+                results[symbol] = cached
+        
+        missing_symbols = [symbol for symbol in symbols if symbol not in results]
+        if not missing_symbols:
+            return results
+        
+        try:
+            logger.debug("Récupération groupée des prix pour %d actions...", len(missing_symbols))
+            
+            # 5 jours pour disposer aussi de la clôture précédente
+            raw = yf.download(missing_symbols, period="5d", interval="1d",
+                              group_by='ticker', threads=True, progress=False,
+                              session=self._session)
+            frames = self._split_download(raw, missing_symbols)
+            
+        except Exception as e:
+            logger.error("Erreur lors de la récupération groupée: %s", e)
+            return results
+        
+        for symbol, frame in frames.items():
+            # Séances complètes seulement (places et jours fériés différents
+            # selon les symboles: la dernière ligne peut être partielle)
+            frame = frame.dropna(subset=['Open', 'High', 'Low', 'Close'])
+            if frame.empty:
+                continue
+            last = frame.iloc[-1]
+            previous_close = frame['Close'].iloc[-2] if len(frame) > 1 else None
+            volume = last['Volume']
+            
+            data = {
+                'symbol': symbol,
+                'name': self._names.get(symbol, symbol),
+                'current_price': float(last['Close']),
+                'open': float(last['Open']),
+                'high': float(last['High']),
+                'low': float(last['Low']),
+                'volume': int(volume) if pd.notna(volume) else 0,
+                'previous_close': float(previous_close) if previous_close is not None else None
+            }
+            self._cache_set(('batch_price', symbol), data)
+            results[symbol] = data
+        
+        missing = len(symbols) - len(results)
+        if missing:
+            logger.warning("%d symbole(s) invalide(s) ou sans données", missing)
+        
+        return results
+    
+    @staticmethod
+    def _split_download(raw: pd.DataFrame, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Découpe le résultat de yf.download(group_by='ticker') en un DataFrame par symbole
+        
+        Args:
+            raw (DataFrame): Résultat de yf.download (colonnes (symbole, champ))
+            symbols (List[str]): Symboles demandés
+        
+        Returns:
+            dict: {symbole: DataFrame}, sans les symboles vides
+        """
+        frames = {}
+        if raw is None or raw.empty:
+            return frames
+        
+        if isinstance(raw.columns, pd.MultiIndex):
+            available = set(raw.columns.get_level_values(0))
+            for symbol in symbols:
+                if symbol in available:
+                    frames[symbol] = raw[symbol]
+        elif len(symbols) == 1:
+            # Anciennes versions de yfinance: colonnes simples pour un seul symbole
+            frames[symbols[0]] = raw
+        
+        # Enlever les lignes vides (symbole invalide, jours sans cotation)
+        frames = {symbol: frame.dropna(how='all') for symbol, frame in frames.items()}
+        return {symbol: frame for symbol, frame in frames.items() if not frame.empty}
+    
     def fetch_historical_data(self, 
                              symbol: str, 
                              period: str = "1mo",
@@ -80,6 +419,10 @@ class DataFetcher:
         """
         Récupère l'historique des prix d'une action
         
+        Le résultat est mémorisé (mémoire puis disque): les appels suivants
+        pour le même (symbole, période, intervalle) ne refont pas la requête.
+        Des appels simultanés depuis plusieurs threads n'en font qu'une.
+        
         Args:
             symbol (str): Symbole boursier
             period (str): Période ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max')
@@ -89,25 +432,241 @@ class DataFetcher:
             DataFrame: Historique avec colonnes [Date, Open, High, Low, Close, Volume]
                       ou None si erreur
         """
+        cached = self._history_get(symbol.upper(), period, interval)
+        if cached is not None:
+            return cached
+        
+        with self._history_lock(symbol.upper(), period, interval):
+            # Un autre thread a pu le télécharger pendant l'attente du verrou
+            cached = self._history_get(symbol.upper(), period, interval)
+            if cached is not None:
+                return cached
+            return self._download_history(symbol, period, interval)
+    
+    def _download_history(self, symbol: str, period: str, interval: str) -> Optional[pd.DataFrame]:
+        """Télécharge un historique avec Ticker.history et le met en cache"""
         try:
-            print(f"Récupération historique {symbol} ({period}, intervalle {interval})...")
+            logger.debug("Récupération historique %s (%s, intervalle %s)...", symbol, period, interval)
             
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             hist = ticker.history(period=period, interval=interval)
+            hist = self._normalize_history(hist) if not hist.empty else hist
             
             if hist.empty:
-                print(f"Aucune donnée historique pour {symbol}")
+                logger.warning("Aucune donnée historique pour %s", symbol)
                 return None
             
-            # Réinitialiser l'index pour avoir Date comme colonne
-            hist = hist.reset_index()
+            logger.debug("%d entrées récupérées pour %s", len(hist), symbol)
+            return self._history_set(symbol.upper(), period, interval, hist)
             
-            print(f"✅ {len(hist)} entrées récupérées pour {symbol}")
-            return hist
+        except Exception as e:
+            logger.error("Erreur lors de la récupération historique de %s: %s", symbol, e)
+            return None
+    
+    def fetch_historical_batch(self,
+                               symbols: List[str],
+                               period: str = "1mo",
+                               interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """
+        Récupère l'historique de plusieurs actions en un seul appel yf.download
+        
+        Les historiques encore en cache ne sont pas redemandés; les autres
+        sont mis en cache comme avec fetch_historical_data.
+        
+        Args:
+            symbols (List[str]): Liste de symboles boursiers
+            period (str): Période ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max')
+            interval (str): Intervalle ('1m', '5m', '1h', '1d', '1wk', '1mo')
+        
+        Returns:
+            dict: {symbole: DataFrame} au même format que fetch_historical_data,
+                  seuls les symboles avec des données sont présents
+        """
+        symbols = [symbol.upper() for symbol in symbols]
+        
+        results = {}
+        for symbol in symbols:
+            cached = self._history_get(symbol, period, interval)
+            if cached is not None:
+                results[symbol] = cached
+        
+        missing_symbols = [symbol for symbol in symbols if symbol not in results]
+        if not missing_symbols:
+            return results
+        
+        try:
+            logger.debug("Récupération groupée de l'historique de %d actions (%s, intervalle %s)...",
+                         len(missing_symbols), period, interval)
+            
+            # auto_adjust=True: mêmes prix que Ticker.history
+            raw = yf.download(missing_symbols, period=period, interval=interval,
+                              group_by='ticker', auto_adjust=True, threads=True,
+                              progress=False, session=self._session)
+            frames = self._split_download(raw, missing_symbols)
             
         except Exception as e:
-            print(f"Erreur lors de la récupération historique de {symbol}: {e}")
+            logger.error("Erreur lors de la récupération groupée de l'historique: %s", e)
+            return results
+        
+        for symbol, frame in frames.items():
+            hist = self._normalize_history(frame)
+            if not hist.empty:
+                results[symbol] = self._history_set(symbol, period, interval, hist)
+        
+        missing = len(symbols) - len(results)
+        if missing:
+            logger.warning("%d symbole(s) sans données historiques", missing)
+        
+        return results
+    
+    def fetch_histories(self,
+                        symbols: List[str],
+                        period: str = "1mo",
+                        interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """
+        Récupère l'historique de plusieurs actions: requête groupée, puis reprise
+        
+        Un seul appel yf.download (fetch_historical_batch) pour tous les
+        symboles; ceux qu'il n'a pas renvoyés (limite de débit, refus) sont
+        redemandés en parallèle au point d'accès "chart" (fetch_all_async).
+        
+        Args:
+            symbols (List[str]): Liste de symboles boursiers
+            period (str): Période ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max')
+            interval (str): Intervalle ('1m', '5m', '1h', '1d', '1wk', '1mo')
+        
+        Returns:
+            dict: {SYMBOLE: DataFrame} dans l'ordre des symboles,
+                  seuls les symboles avec des données sont présents
+        """
+        symbols = [symbol.upper() for symbol in symbols]
+        if not symbols:
+            return {}
+        
+        hists = self.fetch_historical_batch(symbols, period=period, interval=interval)
+        missing = [symbol for symbol in symbols if symbol not in hists]
+        if missing:
+            hists.update(asyncio.run(self.fetch_all_async(missing, period=period, interval=interval)))
+        
+        return {symbol: hists[symbol] for symbol in symbols if symbol in hists}
+    
+    async def fetch_all_async(self,
+                              symbols: List[str],
+                              period: str = "1mo",
+                              interval: str = "1d",
+                              max_concurrency: int = 5) -> Dict[str, pd.DataFrame]:
+        """
+        Récupère l'historique de plusieurs actions en parallèle avec aiohttp
+        
+        Toutes les requêtes partagent une seule session HTTP (connexions
+        réutilisées) et une seule boucle d'événements, sans thread par requête.
+        
+        Args:
+            symbols (List[str]): Liste de symboles boursiers
+            period (str): Période ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', 'max')
+            interval (str): Intervalle ('1m', '5m', '1h', '1d', '1wk', '1mo')
+            max_concurrency (int): Nombre maximal de requêtes simultanées (défaut: 5)
+        
+        Returns:
+            dict: {symbole: DataFrame} au même format que fetch_historical_data,
+                  seuls les symboles avec des données sont présents
+        """
+        symbols = [symbol.upper() for symbol in symbols]
+        
+        results = {}
+        for symbol in symbols:
+            cached = self._history_get(symbol, period, interval)
+            if cached is not None:
+                results[symbol] = cached
+        
+        missing_symbols = [symbol for symbol in symbols if symbol not in results]
+        if not missing_symbols:
+            return results
+        
+        logger.debug("Récupération asynchrone de l'historique de %d actions (%s, intervalle %s)...",
+                     len(missing_symbols), period, interval)
+        
+        sem = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=10)
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=YAHOO_HEADERS) as session:
+            
+            async def fetch_one(symbol: str) -> Optional[pd.DataFrame]:
+                async with sem:
+                    async with session.get(YAHOO_CHART_URL.format(symbol=symbol),
+                                           params={'range': period, 'interval': interval}) as response:
+                        response.raise_for_status()
+                        payload = await response.json()
+                return self._parse_chart(payload, interval)
+            
+            frames = await asyncio.gather(
+                *(fetch_one(symbol) for symbol in missing_symbols),
+                return_exceptions=True
+            )
+        
+        for symbol, hist in zip(missing_symbols, frames):
+            if isinstance(hist, Exception):
+                logger.error("Erreur lors de la récupération historique de %s: %s", symbol, hist)
+                continue
+            if hist is not None:
+                hist = self._normalize_history(hist)
+            if hist is None or hist.empty:
+                logger.warning("Aucune donnée historique pour %s", symbol)
+                continue
+            results[symbol] = self._history_set(symbol, period, interval, hist)
+        
+        return results
+    
+    @staticmethod
+    def _parse_chart(payload: Dict, interval: str) -> Optional[pd.DataFrame]:
+        """
+        Convertit la réponse JSON du point d'accès "chart" en DataFrame
+        
+        Les prix sont ajustés (dividendes, divisions) comme avec
+        Ticker.history(auto_adjust=True).
+        
+        Args:
+            payload (dict): Réponse JSON de Yahoo Finance
+            interval (str): Intervalle demandé
+        
+        Returns:
+            DataFrame: Colonnes [Date, Open, High, Low, Close, Volume] brutes
+                       (à passer par _normalize_history), ou None si vide
+        """
+        result = (payload.get('chart') or {}).get('result')
+        if not result:
+            return None
+        result = result[0]
+        
+        timestamps = result.get('timestamp')
+        if not timestamps:
             return None
+        
+        quote = result['indicators']['quote'][0]
+        hist = pd.DataFrame({
+            'Open': quote.get('open'),
+            'High': quote.get('high'),
+            'Low': quote.get('low'),
+            'Close': quote.get('close'),
+            'Volume': quote.get('volume'),
+        }, dtype=np.float64)
+        
+        # Ajustement des prix par le ratio clôture ajustée / clôture
+        adjclose = result['indicators'].get('adjclose')
+        if adjclose:
+            ratio = np.asarray(adjclose[0]['adjclose'], dtype=np.float64) / hist['Close'].to_numpy()
+            for column in ('Open', 'High', 'Low', 'Close'):
+                hist[column] = hist[column].to_numpy() * ratio
+        
+        # Dates dans le fuseau de la place de cotation (minuit pour les données journalières)
+        tz = result.get('meta', {}).get('exchangeTimezoneName', 'UTC')
+        dates = pd.to_datetime(timestamps, unit='s', utc=True).tz_convert(tz)
+        if interval[-1] not in ('m', 'h'):
+            dates = dates.normalize()
+        hist.insert(0, 'Date', dates)
+        return hist
     
     def update_stock_from_api(self, stock: Stock) -> bool:
         """
@@ -138,11 +697,11 @@ class DataFetcher:
                 volume=data['volume']
             )
             
-            print(f" Stock {stock.symbol} mis à jour avec succès")
+            logger.debug("Stock %s mis à jour avec succès", stock.symbol)
             return True
             
         except Exception as e:
-            print(f" Erreur lors de la mise à jour de {stock.symbol}: {e}")
+            logger.error("Erreur lors de la mise à jour de %s: %s", stock.symbol, e)
             return False
     
     def create_stock_from_api(self, symbol: str) -> Optional[Stock]:
@@ -161,25 +720,56 @@ class DataFetcher:
             if data is None:
                 return None
             
-            # Créer le stock
-            stock = Stock(symbol=data['symbol'], name=data['name'])
+            stock = self._stock_from_data(data)
             
-            # Remplir avec les données
-            stock.update_price(
-                new_price=data['current_price'],
-                opening=data['open'],
-                high=data['high'],
-                low=data['low'],
-                volume=data['volume']
-            )
-            
-            print(f"✅ Stock {symbol} créé avec succès")
+            logger.debug("Stock %s créé avec succès", symbol)
             return stock
             
         except Exception as e:
-            print(f" Erreur lors de la création du stock {symbol}: {e}")
+            logger.error("Erreur lors de la création du stock %s: %s", symbol, e)
             return None
     
+    def create_stocks_from_api(self, symbols: List[str]) -> List[Stock]:
+        """
+        Crée plusieurs objets Stock avec un seul appel groupé (fetch_many_current)
+        
+        Args:
+            symbols (List[str]): Liste de symboles boursiers
+        
+        Returns:
+            List[Stock]: Stocks créés, dans l'ordre des symboles (symboles invalides ignorés)
+        """
+        data_by_symbol = self.fetch_many_current(symbols)
+        now = datetime.now()  # Même horodatage pour tout le lot
+        return [
+            self._stock_from_data(data_by_symbol[symbol.upper()], now)
+            for symbol in symbols
+            if symbol.upper() in data_by_symbol
+        ]
+    
+    @staticmethod
+    def _stock_from_data(data: Dict, now: Optional[datetime] = None) -> Stock:
+        """
+        Construit un Stock à partir des données renvoyées par l'API
+        
+        Args:
+            data (dict): Données au format de fetch_current_price
+            now (datetime, optional): Date de mise à jour (défaut: datetime.now())
+        
+        Returns:
+            Stock: Objet Stock rempli
+        """
+        stock = Stock(symbol=data['symbol'], name=data['name'])
+        stock.update_price(
+            new_price=data['current_price'],
+            opening=data['open'],
+            high=data['high'],
+            low=data['low'],
+            volume=data['volume'],
+            now=now
+        )
+        return stock
+    
     def fetch_multiple_stocks_sync(self, symbols: List[str]) -> List[Stock]:
         """
         Récupère plusieurs actions de manière synchrone (une par une)
@@ -193,16 +783,43 @@ class DataFetcher:
         """
         stocks = []
         
-        print(f" Récupération synchrone de {len(symbols)} actions...")
-        start_time = datetime.now()
+        logger.debug("Récupération synchrone de %d actions...", len(symbols))
+        t0 = time.perf_counter()
         
         for symbol in symbols:
             stock = self.create_stock_from_api(symbol)
             if stock:
                 stocks.append(stock)
         
-        elapsed = (datetime.now() - start_time).total_seconds()
-        print(f" Temps écoulé (sync): {elapsed:.2f}s pour {len(stocks)}/{len(symbols)} actions")
+        elapsed = time.perf_counter() - t0
+        logger.info("Temps écoulé (sync): %.2fs pour %d/%d actions", elapsed, len(stocks), len(symbols))
+        
+        return stocks
+    
+    def fetch_multiple_stocks_threaded(self, symbols: List[str], max_workers: int = 8) -> List[Stock]:
+        """
+        Récupère plusieurs actions en parallèle avec un pool de threads
+        
+        Même résultat que fetch_multiple_stocks_sync: les requêtes HTTP
+        (bloquantes) se recouvrent au lieu de s'enchaîner. Sert de point de
+        comparaison avec AsyncFetcher.
+        
+        Args:
+            symbols (List[str]): Liste de symboles boursiers
+            max_workers (int): Nombre maximal de requêtes simultanées (défaut: 8)
+        
+        Returns:
+            List[Stock]: Stocks créés, dans l'ordre des symboles (erreurs ignorées)
+        """
+        logger.debug("Récupération (threads) de %d actions...", len(symbols))
+        t0 = time.perf_counter()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.create_stock_from_api, symbols)
+            stocks = [stock for stock in results if stock]
+        
+        elapsed = time.perf_counter() - t0
+        logger.info("Temps écoulé (threads): %.2fs pour %d/%d actions", elapsed, len(stocks), len(symbols))
         
         return stocks
     
@@ -217,7 +834,7 @@ class DataFetcher:
             dict: Informations complètes (secteur, industrie, capitalisation, etc.)
         """
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             info = ticker.info
             
             return {
@@ -235,5 +852,5 @@ class DataFetcher:
             }
             
         except Exception as e:
-            print(f" Erreur lors de la récupération des infos de {symbol}: {e}")
+            logger.error("Erreur lors de la récupération des infos de %s: %s", symbol, e)
             return None
\ No newline at end of file
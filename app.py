@@ -6,15 +6,29 @@ Interface graphique moderne et simple
 import streamlit as st
 import sys
 import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Backend sans interface graphique (avant tout import de pyplot)
+import matplotlib
+matplotlib.use('Agg')
+
 from api.data_fetcher import DataFetcher
 from models.portfolio import Portfolio
 from analysis.statistics import Analyzer
-from analysis.indicators import TechnicalIndicators
+from analysis._kernels import warm_up
+from models._kernels import warm_up as warm_up_models
 from visualization.charts import ChartGenerator
-from utils.action_dict import ACTIONS_LISTE, rechercher_action
-import matplotlib.pyplot as plt
+from utils.action_dict import ACTIONS_LISTE, NAME_TO_SYMBOL
+import pandas as pd
+
+# Dossier des exports (PDF)
+os.makedirs('data/exports', exist_ok=True)
+
+# Options des listes déroulantes (construites une seule fois)
+_ACTIONS_WITH_BLANK = ("",) + tuple(ACTIONS_LISTE)
 
 # Configuration de la page
 st.set_page_config(
@@ -36,80 +50,57 @@ def get_fetcher():
 def get_chart_gen():
     return ChartGenerator()
 
+# Compilation numba des indicateurs une seule fois par processus
+@st.cache_resource
+def warm_up_kernels():
+    warm_up()
+    warm_up_models()
+    return True
+
 fetcher = get_fetcher()
 chart_gen = get_chart_gen()
+warm_up_kernels()
 
-# Sidebar - Menu
-st.sidebar.title("Menu")
-page = st.sidebar.radio(
-    "Navigation",
-    ["🏠 Accueil", "📈 Analyse d'action", "💼 Portfolio", "📄 Générer rapport"]
-)
+# Résultats des appels réseau gardés 5 minutes (DataFrames = données, pas ressources)
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_stock(symbol):
+    return get_fetcher().create_stock_from_api(symbol)
 
-st.sidebar.markdown("---")
-st.sidebar.info("Projet M1 - Trading Analyzer\n\nAnalyse technique et financière")
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_hist(symbol, period):
+    return get_fetcher().fetch_historical_data(symbol, period)
 
-# ========== PAGE 1 : ACCUEIL ==========
-if page == "🏠 Accueil":
-    st.header("Bienvenue sur Trading Analyzer")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.info("📈 **Analyse technique**\n\nRSI, moyennes mobiles, tendances")
-    
-    with col2:
-        st.success("📊 **Visualisations**\n\nGraphiques interactifs et professionnels")
-    
-    with col3:
-        st.warning("📄 **Rapports PDF**\n\nGénération automatique de rapports")
-    
-    st.markdown("---")
-    
-    st.subheader("Fonctionnalités")
-    
-    st.write("✅ **Analyse d'action** : Recherchez n'importe quelle action et obtenez une analyse complète")
-    st.write("✅ **Portfolio** : Créez et gérez votre portfolio d'actions")
-    st.write("✅ **Graphiques** : Visualisations avec moyennes mobiles et indicateurs")
-    st.write("✅ **Indicateurs techniques** : RSI, signaux d'achat/vente, tendances")
-    
-    st.info("👈 Utilisez le menu à gauche pour naviguer dans l'application")
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_hist_batch(symbols, period):
+    # Un yf.download groupé, puis requêtes aiohttp simultanées pour les
+    # symboles manquants (même chemin que main.fetch_histories)
+    return get_fetcher().fetch_histories(list(symbols), period)
 
-# ========== PAGE 2 : ANALYSE D'ACTION ==========
-elif page == "📈 Analyse d'action":
-    st.header("Analyse détaillée d'une action")
-    
-    # Choix du mode de saisie
-    mode = st.radio("Mode de recherche", ["🔍 Recherche par nom", "⌨️ Saisie manuelle du symbole"], horizontal=True)
-    
-    symbol = None
-    
-    if mode == "🔍 Recherche par nom":
-        # Sélection dans la liste
-        selected_name = st.selectbox(
-            "Choisissez une action",
-            options=[""] + ACTIONS_LISTE,
-            index=0,
-            help="Sélectionnez une action dans la liste"
-        )
-        
-        if selected_name:
-            symbol = rechercher_action(selected_name)
-            st.info(f"📊 Action sélectionnée: **{selected_name}** → Symbole: **{symbol}**")
-    
-    else:
-        # Saisie manuelle
-        symbol_input = st.text_input(
-            "Symbole de l'action",
-            "",
-            max_chars=10,
-            help="Exemple: AAPL, GOOGL, MSFT"
-        ).upper()
-        
-        if symbol_input:
-            symbol = symbol_input
-    
-    # Bouton d'analyse
+# Indicateurs calculés une seule fois par (symbole, période): l'historique est
+# obtenu dans la fonction, Streamlit ne hache que les arguments
+@st.cache_data(ttl=300, show_spinner=False)
+def _analysis_bundle(symbol, period, window=20, rsi_period=14):
+    hist = _cached_hist(symbol, period)
+    if hist is None or hist.empty:
+        return None
+    return Analyzer(hist).compute_all(window=window, rsi_period=rsi_period)
+
+# Graphique rendu une seule fois en PNG (pas de redessin matplotlib à chaque rerun)
+@st.cache_data(ttl=300, show_spinner=False)
+def _render_price_ma_png(symbol, period, window, title) -> bytes:
+    hist = _cached_hist(symbol, period)
+    ma = _analysis_bundle(symbol, period, window)['ma']
+    chart_gen = get_chart_gen()
+    fig = chart_gen.create_price_with_ma(hist, ma, title, window=window)
+    png = chart_gen.save_chart_buf(fig).getvalue()
+    # Chaque rerun Streamlit tourne dans un nouveau thread: la figure de ce
+    # thread ne serait jamais réutilisée, elle est fermée tout de suite
+    chart_gen.close(fig)
+    return png
+
+# Résultats d'analyse: cliquer sur "Analyser" ne réexécute que ce bloc
+@st.fragment
+def _render_analysis(symbol):
     st.markdown("---")
     
     analyze_btn = st.button("🔍 Analyser", type="primary", disabled=(symbol is None or symbol == ""))
@@ -117,8 +108,12 @@ elif page == "📈 Analyse d'action":
     if analyze_btn and symbol:
         with st.spinner(f"Analyse de {symbol} en cours..."):
             try:
-                # Récupérer les données
-                stock = fetcher.create_stock_from_api(symbol)
+                # Récupérer les données (infos et historique en parallèle)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    stock_future = executor.submit(_cached_stock, symbol)
+                    hist_future = executor.submit(_cached_hist, symbol, "3mo")
+                    stock = stock_future.result()
+                    hist = hist_future.result()
                 
                 if stock:
                     # Afficher les infos principales
@@ -143,25 +138,17 @@ elif page == "📈 Analyse d'action":
                     
                     st.markdown("---")
                     
-                    # Récupérer l'historique
-                    hist = fetcher.fetch_historical_data(symbol, period="3mo")
-                    
                     if hist is not None and not hist.empty:
                         # Analyse
-                        analyzer = Analyzer(hist)
-                        indicators = TechnicalIndicators(hist)
+                        results = _analysis_bundle(symbol, "3mo")
                         
                         # Graphique
                         st.subheader("📈 Graphique de prix avec moyenne mobile")
                         
-                        ma = analyzer.calculate_moving_average(20)
-                        fig = chart_gen.create_price_with_ma(
-                            hist, ma,
-                            f"Prix de {symbol} - 3 derniers mois",
-                            window=20
-                        )
-                        st.pyplot(fig)
-                        plt.close()
+                        st.image(_render_price_ma_png(
+                            symbol, "3mo", 20,
+                            f"Prix de {symbol} - 3 derniers mois"
+                        ))
                         
                         st.markdown("---")
                         
@@ -170,24 +157,24 @@ elif page == "📈 Analyse d'action":
                         
                         with col1:
                             st.subheader("📊 Statistiques")
-                            stats = analyzer.get_statistics()
+                            stats = results['stats']
                             
                             st.write(f"**Prix moyen (3 mois):** ${stats['prix_moyen']:.2f}")
                             st.write(f"**Prix minimum:** ${stats['prix_min']:.2f}")
                             st.write(f"**Prix maximum:** ${stats['prix_max']:.2f}")
                             
-                            vol = analyzer.calculate_volatility()
+                            vol = results['volatility']
                             if vol:
                                 st.write(f"**Volatilité:** {vol:.2f}%")
                             
-                            trend = analyzer.calculate_trend()
+                            trend = results['trend']
                             trend_emoji = "📈" if trend == "HAUSSE" else "📉" if trend == "BAISSE" else "➡️"
                             st.write(f"**Tendance:** {trend_emoji} {trend}")
                         
                         with col2:
                             st.subheader("🎯 Indicateurs techniques")
                             
-                            rsi = indicators.calculate_rsi()
+                            rsi = results['rsi']
                             if rsi:
                                 st.write(f"**RSI (14 jours):** {rsi:.2f}")
                                 
@@ -200,7 +187,7 @@ elif page == "📈 Analyse d'action":
                             
                             st.write("")
                             
-                            signal = indicators.get_simple_signal()
+                            signal = results['signal']
                             
                             if signal == "ACHETER":
                                 st.success(f"**Signal:** 🟢 {signal}")
@@ -218,6 +205,139 @@ elif page == "📈 Analyse d'action":
             except Exception as e:
                 st.error(f"❌ Erreur lors de l'analyse : {str(e)}")
 
+# Affichage du portfolio: les interactions ne réexécutent que ce bloc
+@st.fragment
+def _render_portfolio(portfolio):
+    if portfolio.get_stocks_count() > 0:
+        st.subheader(f"📊 {portfolio.name}")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("Nombre d'actions", portfolio.get_stocks_count())
+        
+        with col2:
+            st.metric("Valeur totale", f"${portfolio.get_total_value():.2f}")
+        
+        with col3:
+            st.metric("Variation moyenne", 
+                     f"{portfolio.get_average_variation():.2f}%",
+                     delta=f"{portfolio.get_average_variation():.2f}%")
+        
+        st.markdown("---")
+        
+        # Tableau des actions
+        st.subheader("Actions du portfolio")
+        
+        # Colonnes construites directement (format natif de pandas), valeurs
+        # numériques formatées par Streamlit côté navigateur
+        stocks = portfolio.stocks
+        data = {
+            "Symbole": [s.symbol for s in stocks],
+            "Nom": [s.name for s in stocks],
+            "Prix": [s.current_price for s in stocks],
+            "Variation": [s.get_variation() for s in stocks]
+        }
+        
+        st.dataframe(
+            pd.DataFrame(data),
+            column_config={
+                "Prix": st.column_config.NumberColumn(format="$%.2f"),
+                "Variation": st.column_config.NumberColumn(format="%+.2f%%")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Meilleure et pire performance
+        if portfolio.get_stocks_count() > 0:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                best = portfolio.get_best_performer()
+                st.success(f"🏆 **Meilleure:** {best.symbol} ({best.get_variation():+.2f}%)")
+            
+            with col2:
+                worst = portfolio.get_worst_performer()
+                st.info(f"📉 **Moins bonne:** {worst.symbol} ({worst.get_variation():+.2f}%)")
+    
+    else:
+        st.info("📭 Portfolio vide. Ajoutez des actions ci-dessus.")
+
+
+# Sidebar - Menu
+st.sidebar.title("Menu")
+page = st.sidebar.radio(
+    "Navigation",
+    ["🏠 Accueil", "📈 Analyse d'action", "💼 Portfolio", "📄 Générer rapport"]
+)
+
+st.sidebar.markdown("---")
+st.sidebar.info("Projet M1 - Trading Analyzer\n\nAnalyse technique et financière")
+
+# ========== PAGE 1 : ACCUEIL ==========
+if page == "🏠 Accueil":
+    st.header("Bienvenue sur Trading Analyzer")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.info("📈 **Analyse technique**\n\nRSI, moyennes mobiles, tendances")
+    
+    with col2:
+        st.success("📊 **Visualisations**\n\nGraphiques interactifs et professionnels")
+    
+    with col3:
+        st.warning("📄 **Rapports PDF**\n\nGénération automatique de rapports")
+    
+    st.markdown("---")
+    
+    st.subheader("Fonctionnalités")
+    
+    st.write("✅ **Analyse d'action** : Recherchez n'importe quelle action et obtenez une analyse complète")
+    st.write("✅ **Portfolio** : Créez et gérez votre portfolio d'actions")
+    st.write("✅ **Graphiques** : Visualisations avec moyennes mobiles et indicateurs")
+    st.write("✅ **Indicateurs techniques** : RSI, signaux d'achat/vente, tendances")
+    
+    st.info("👈 Utilisez le menu à gauche pour naviguer dans l'application")
+
+# ========== PAGE 2 : ANALYSE D'ACTION ==========
+elif page == "📈 Analyse d'action":
+    st.header("Analyse détaillée d'une action")
+    
+    # Choix du mode de saisie
+    mode = st.radio("Mode de recherche", ["🔍 Recherche par nom", "⌨️ Saisie manuelle du symbole"], horizontal=True)
+    
+    symbol = None
+    
+    if mode == "🔍 Recherche par nom":
+        # Sélection dans la liste
+        selected_name = st.selectbox(
+            "Choisissez une action",
+            options=_ACTIONS_WITH_BLANK,
+            index=0,
+            help="Sélectionnez une action dans la liste"
+        )
+        
+        if selected_name:
+            symbol = NAME_TO_SYMBOL[selected_name]
+            st.info(f"📊 Action sélectionnée: **{selected_name}** → Symbole: **{symbol}**")
+    
+    else:
+        # Saisie manuelle
+        symbol_input = st.text_input(
+            "Symbole de l'action",
+            "",
+            max_chars=10,
+            help="Exemple: AAPL, GOOGL, MSFT"
+        ).upper()
+        
+        if symbol_input:
+            symbol = symbol_input
+    
+    # Bouton d'analyse et résultats (fragment: rerun limité à ce bloc)
+    _render_analysis(symbol)
+
 # ========== PAGE 3 : PORTFOLIO ==========
 elif page == "💼 Portfolio":
     st.header("Gestion de Portfolio")
@@ -247,7 +367,7 @@ elif page == "💼 Portfolio":
         with col1:
             selected_action = st.selectbox(
                 "Choisissez une action à ajouter",
-                options=[""] + ACTIONS_LISTE,
+                options=_ACTIONS_WITH_BLANK,
                 key="portfolio_select"
             )
         
@@ -257,7 +377,7 @@ elif page == "💼 Portfolio":
             add_btn = st.button("➕ Ajouter", key="add_from_list")
         
         if add_btn and selected_action:
-            new_symbol = rechercher_action(selected_action)
+            new_symbol = NAME_TO_SYMBOL[selected_action]
     
     else:
         col1, col2 = st.columns([3, 1])
@@ -276,7 +396,7 @@ elif page == "💼 Portfolio":
     if new_symbol:
         with st.spinner(f"Ajout de {new_symbol}..."):
             try:
-                stock = fetcher.create_stock_from_api(new_symbol)
+                stock = _cached_stock(new_symbol)
                 if stock:
                     portfolio.add_stock(stock)
                     st.success(f"✅ {new_symbol} ajouté au portfolio")
@@ -287,53 +407,8 @@ elif page == "💼 Portfolio":
     
     st.markdown("---")
     
-    # Afficher le portfolio
-    if portfolio.get_stocks_count() > 0:
-        st.subheader(f"📊 {portfolio.name}")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Nombre d'actions", portfolio.get_stocks_count())
-        
-        with col2:
-            st.metric("Valeur totale", f"${portfolio.get_total_value():.2f}")
-        
-        with col3:
-            st.metric("Variation moyenne", 
-                     f"{portfolio.get_average_variation():.2f}%",
-                     delta=f"{portfolio.get_average_variation():.2f}%")
-        
-        st.markdown("---")
-        
-        # Tableau des actions
-        st.subheader("Actions du portfolio")
-        
-        data = []
-        for stock in portfolio.stocks:
-            data.append({
-                "Symbole": stock.symbol,
-                "Nom": stock.name,
-                "Prix": f"${stock.current_price:.2f}",
-                "Variation": f"{stock.get_variation():+.2f}%"
-            })
-        
-        st.dataframe(data, use_container_width=True)
-        
-        # Meilleure et pire performance
-        if portfolio.get_stocks_count() > 0:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                best = portfolio.get_best_performer()
-                st.success(f"🏆 **Meilleure:** {best.symbol} ({best.get_variation():+.2f}%)")
-            
-            with col2:
-                worst = portfolio.get_worst_performer()
-                st.info(f"📉 **Moins bonne:** {worst.symbol} ({worst.get_variation():+.2f}%)")
-    
-    else:
-        st.info("📭 Portfolio vide. Ajoutez des actions ci-dessus.")
+    # Afficher le portfolio (fragment: rerun limité à ce bloc)
+    _render_portfolio(portfolio)
 
 # ========== PAGE 4 : GENERER RAPPORT ==========
 elif page == "📄 Générer rapport":
@@ -370,7 +445,7 @@ elif page == "📄 Générer rapport":
         )
         
         # Convertir en symboles
-        symbols = [rechercher_action(nom) for nom in actions_selectionnees]
+        symbols = [NAME_TO_SYMBOL[nom] for nom in actions_selectionnees]
     
     else:
         # Saisie manuelle
@@ -395,49 +470,48 @@ elif page == "📄 Générer rapport":
         else:
             with st.spinner(f"Génération du rapport pour {', '.join(symbols)}... Cela peut prendre 30-60 secondes..."):
                 try:
-                    from api.data_fetcher import DataFetcher
-                    from models.portfolio import Portfolio
-                    from analysis.statistics import Analyzer
-                    from analysis.indicators import TechnicalIndicators
-                    from visualization.charts import ChartGenerator
+                    # Imports différés: un module de rapport absent ou ReportLab
+                    # non installé n'empêche que la génération du PDF
                     from reports.pdf_generator import PDFGenerator
                     from reportlab.lib.units import cm
-                    from datetime import datetime
-                    import matplotlib.pyplot as plt
-                    
-                    # Créer les dossiers nécessaires
-                    os.makedirs('data/exports', exist_ok=True)
-                    
-                    # Initialiser
-                    fetcher = DataFetcher()
-                    chart_gen = ChartGenerator()
                     
                     # Progress bar
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    # 1. Récupérer les données
+                    # 1. Récupérer les données (toutes les requêtes en parallèle,
+                    #    historiques via un yf.download groupé, repris en asyncio)
                     status_text.text("📥 Récupération des données...")
-                    stocks = []
+                    stocks_by_symbol = {}
                     stocks_history = {}
                     
-                    for i, symbol in enumerate(symbols):
-                        progress_bar.progress((i + 1) / (len(symbols) * 3))
-                        
-                        stock = fetcher.create_stock_from_api(symbol)
-                        if stock:
-                            stocks.append(stock)
+                    with ThreadPoolExecutor(max_workers=min(10, len(symbols) + 1)) as executor:
+                        futures = {executor.submit(_cached_hist_batch, tuple(symbols), "3mo"): None}
+                        for symbol in symbols:
+                            futures[executor.submit(_cached_stock, symbol)] = symbol
                         
-                        hist = fetcher.fetch_historical_data(symbol, period="3mo")
-                        if hist is not None and not hist.empty:
-                            stocks_history[symbol] = hist
+                        for done, future in enumerate(as_completed(futures), start=1):
+                            progress_bar.progress(done / (len(futures) * 3))
+                            
+                            symbol = futures[future]
+                            result = future.result()
+                            if symbol is None:
+                                stocks_history = result
+                            elif result:
+                                stocks_by_symbol[symbol] = result
+                    
+                    # Conserver l'ordre des symboles choisis
+                    stocks = [stocks_by_symbol[s] for s in symbols if s in stocks_by_symbol]
+                    stocks_history = {s: stocks_history[s] for s in symbols if s in stocks_history}
                     
                     if len(stocks) == 0:
                         st.error("❌ Aucune action valide trouvée")
                     else:
-                        # 2. Créer les graphiques
+                        # 2. Analyses et graphiques (un seul passage par action)
                         status_text.text("📊 Création des graphiques...")
-                        graph_files = []
+                        comparison_buf = None
+                        per_symbol = {}
+                        report_figs = []  # Figures de ce rapport, fermées à la fin
                         
                         # Graphique de comparaison
                         if len(stocks_history) > 1:
@@ -445,31 +519,39 @@ elif page == "📄 Générer rapport":
                                 stocks_history,
                                 "Comparaison des performances (3 mois)"
                             )
-                            chart_gen.save_chart(fig_comp, "rapport_comparaison.png")
-                            graph_files.append("data/exports/rapport_comparaison.png")
-                            plt.close()
+                            comparison_buf = chart_gen.save_chart_buf(fig_comp, dpi=80)
+                            report_figs.append(fig_comp)
                         
-                        # Graphiques individuels
+                        # Analyse et graphique de chaque action, réutilisés par le PDF
                         for j, symbol in enumerate(symbols):
                             if symbol in stocks_history:
                                 progress_bar.progress((len(symbols) + j + 1) / (len(symbols) * 3))
                                 
+                                # Indicateurs calculés sur l'historique tracé: la moyenne
+                                # mobile a toujours les mêmes lignes que les prix
                                 hist = stocks_history[symbol]
-                                analyzer = Analyzer(hist)
-                                ma = analyzer.calculate_moving_average(20)
+                                results = Analyzer(hist).compute_all(window=20, rsi_period=14)
                                 
                                 fig = chart_gen.create_price_with_ma(
-                                    hist, ma,
+                                    hist, results['ma'],
                                     f"Prix de {symbol} avec Moyenne Mobile (20j)",
                                     window=20
                                 )
                                 
-                                filename = f"rapport_{symbol.lower()}.png"
-                                chart_gen.save_chart(fig, filename)
-                                graph_files.append(f"data/exports/{filename}")
-                                plt.close()
+                                # PNG en mémoire, sans passer par data/exports (la
+                                # figure est vidée et réutilisée pour l'action suivante)
+                                fig_buf = chart_gen.save_chart_buf(fig, dpi=80)
+                                if fig not in report_figs:
+                                    report_figs.append(fig)
+                                
+                                per_symbol[symbol] = {
+                                    "results": results,
+                                    "fig_buf": fig_buf
+                                }
                         
-                        chart_gen.close_all()
+                        # Seulement les figures de ce rapport: chart_gen est partagé
+                        # par toutes les sessions (cache_resource)
+                        chart_gen.close(*report_figs)
                         
                         # 3. Générer le PDF
                         status_text.text("📄 Génération du PDF...")
@@ -503,57 +585,54 @@ elif page == "📄 Générer rapport":
                         pdf.add_table(table_data, col_widths=[3*cm, 7*cm, 3*cm, 3*cm])
                         
                         # Section 2 : Graphique de comparaison
-                        if len(graph_files) > 0 and len(stocks_history) > 1:
+                        if comparison_buf is not None:
                             pdf.add_page_break()
                             pdf.add_heading("2. Comparaison des Performances")
                             pdf.add_text("Les prix sont normalises (base 100) pour faciliter la comparaison.")
                             pdf.add_spacer()
-                            pdf.add_image(graph_files[0], width=10*cm, height=7*cm)
+                            pdf.add_image(comparison_buf, width=10*cm, height=7*cm)
                         
                         # Section 3 : Analyses détaillées
                         pdf.add_page_break()
                         pdf.add_heading("3. Analyse Detaillee par Action")
                         
                         for i, symbol in enumerate(symbols):
-                            if symbol not in stocks_history:
+                            if symbol not in per_symbol:
                                 continue
                             
-                            stock = next((s for s in stocks if s.symbol == symbol), None)
+                            stock = stocks_by_symbol.get(symbol)
                             if stock:
                                 pdf.add_text(f"<b>{symbol} - {stock.name}</b>")
                             
                             pdf.add_spacer(0.3*cm)
                             
-                            hist = stocks_history[symbol]
-                            analyzer = Analyzer(hist)
-                            indicators = TechnicalIndicators(hist)
+                            entry = per_symbol[symbol]
+                            results = entry["results"]
                             
                             # Statistiques
-                            stats = analyzer.get_statistics()
+                            stats = results['stats']
                             pdf.add_text(f"Prix moyen (3 mois): ${stats['prix_moyen']:.2f}")
                             pdf.add_text(f"Prix minimum: ${stats['prix_min']:.2f}")
                             pdf.add_text(f"Prix maximum: ${stats['prix_max']:.2f}")
                             
-                            vol = analyzer.calculate_volatility()
+                            vol = results['volatility']
                             if vol:
                                 pdf.add_text(f"Volatilite: {vol:.2f}%")
                             
-                            trend = analyzer.calculate_trend()
+                            trend = results['trend']
                             pdf.add_text(f"Tendance: {trend}")
                             
-                            rsi = indicators.calculate_rsi()
+                            rsi = results['rsi']
                             if rsi:
                                 pdf.add_text(f"RSI (14 jours): {rsi:.2f}")
                             
-                            signal = indicators.get_simple_signal()
+                            signal = results['signal']
                             pdf.add_text(f"<b>Signal de trading: {signal}</b>")
                             
                             pdf.add_spacer()
                             
                             # Graphique
-                            graph_index = i + (1 if len(stocks_history) > 1 else 0)
-                            if graph_index < len(graph_files):
-                                pdf.add_image(graph_files[graph_index], width=10*cm, height=7*cm)
+                            pdf.add_image(entry["fig_buf"], width=10*cm, height=7*cm)
                             
                             if i < len(symbols) - 1:
                                 pdf.add_page_break()
@@ -583,7 +662,6 @@ elif page == "📄 Générer rapport":
                 except Exception as e:
                     st.error(f"❌ Erreur lors de la génération : {str(e)}")
                     st.code(str(e))
-                    import traceback
                     st.code(traceback.format_exc())
 
 # Footer
@@ -1,75 +1,247 @@
 """
 Classe DatabaseManager - Gestion de la base de données SQLite
 """
+import functools
+import logging
 import sqlite3
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date
 import os
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1024)
+def _upper(symbol: str) -> str:
+    """Symbole en majuscules, mémorisé (les mêmes symboles reviennent sans cesse)"""
+    return symbol.upper()
+
+
+def _read_schema() -> Optional[str]:
+    """Lit schema.sql une seule fois par processus (None s'il est absent)"""
+    schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+_SCHEMA_SQL = _read_schema()
+
+# Réglages de performance de chaque connexion:
+# - WAL + synchronous=NORMAL: un seul fsync par commit (au checkpoint), et
+#   les lecteurs ne bloquent plus l'écrivain. Si WAL est impossible (système
+#   de fichiers réseau, ...), SQLite garde simplement le journal classique.
+# - cache de 64 Mo, tables temporaires en mémoire, mmap de 256 Mo
+_READ_PRAGMAS_SQL = """
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA mmap_size = 268435456;
+PRAGMA foreign_keys = ON;
+PRAGMA busy_timeout = 5000;
+"""
+
+_PRAGMAS_SQL = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+""" + _READ_PRAGMAS_SQL
+
+# PRAGMA + schéma, exécutés en un seul executescript à l'ouverture
+_STARTUP_SQL = _PRAGMAS_SQL + (_SCHEMA_SQL or "")
+
+# Objets dont la présence indique que le schéma a déjà été créé
+_SCHEMA_OBJECTS = (
+    ('stocks', 'stock_prices', 'portfolios', 'portfolio_stocks', 'v_portfolio_details')
+    if _SCHEMA_SQL is not None else ('stocks', 'stock_prices')
+)
+
+# Le nom n'est remplacé que par un vrai nom: un nom égal au symbole
+# (nom d'entreprise inconnu de l'API) garde le nom déjà enregistré.
+# Pas d'upsert ON CONFLICT: chaque conflit consommerait un ID AUTOINCREMENT
+_SQL_UPDATE_STOCK_NAME = (
+    "UPDATE stocks SET name = ?1 WHERE symbol = ?2 AND ?1 <> ?2 AND name <> ?1"
+)
+
+_SQL_INSERT_STOCK = "INSERT INTO stocks (symbol, name) VALUES (?, ?)"
+
+# Requêtes fréquentes: le texte identique à chaque appel permet à sqlite3
+# de retrouver l'instruction déjà préparée dans son cache
+_SQL_GET_STOCK_ID = "SELECT id FROM stocks WHERE symbol = ?"
+
+_SQL_INSERT_PRICE = """
+    INSERT OR IGNORE INTO stock_prices
+    (stock_id, date, opening_price, closing_price, highest_price, lowest_price, volume)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_LATEST_PRICE = """
+    SELECT date, opening_price, closing_price, highest_price, lowest_price, volume
+    FROM stock_prices
+    WHERE stock_id = ?
+    ORDER BY date DESC
+    LIMIT 1
+"""
+
+# Type des lignes renvoyées par get_stock_history_arrays
+_HISTORY_DTYPE = np.dtype([
+    ('date', 'datetime64[s]'),
+    ('open', np.float64),
+    ('close', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('volume', np.int64),
+])
+
+_SQL_GET_ALL_STOCKS = "SELECT id, symbol, name FROM stocks ORDER BY symbol"
+
+# Dernier prix de chaque action: le MAX(date) par action est lu en haut
+# de l'index UNIQUE(stock_id, date)
+_SQL_GET_LATEST_PRICES_ALL = """
+    SELECT s.symbol, s.name, p.date, p.opening_price, p.closing_price,
+           p.highest_price, p.lowest_price, p.volume
+    FROM stocks s
+    JOIN stock_prices p ON p.stock_id = s.id
+    JOIN (SELECT stock_id, MAX(date) AS d FROM stock_prices GROUP BY stock_id) m
+      ON m.stock_id = p.stock_id AND m.d = p.date
+    ORDER BY s.symbol
+"""
+
+# Toutes les actions avec leur dernier prix (colonnes de prix à NULL si
+# aucun prix enregistré): une seule requête pour la liste complète
+_SQL_GET_ALL_STOCKS_WITH_LATEST = """
+    SELECT s.id, s.symbol, s.name, p.date, p.opening_price, p.closing_price,
+           p.highest_price, p.lowest_price, p.volume
+    FROM stocks s
+    LEFT JOIN (SELECT stock_id, MAX(date) AS d FROM stock_prices GROUP BY stock_id) m
+      ON m.stock_id = s.id
+    LEFT JOIN stock_prices p ON p.stock_id = m.stock_id AND p.date = m.d
+    ORDER BY s.symbol
+"""
+
 
 class DatabaseManager:
     """
     Classe responsable de toutes les interactions avec la base de données
     
+    Un objet par thread: la connexion, son curseur partagé et l'état des
+    transactions ne sont pas protégés par un verrou. sqlite3 refuse
+    l'utilisation de la connexion depuis un autre thread que celui qui l'a
+    ouverte (check_same_thread par défaut).
+    
     Attributes:
         db_path (str): Chemin vers le fichier de base de données
         connection (sqlite3.Connection): Connexion à la base de données
     """
     
-    def __init__(self, db_path: str = "data/stocks.db"):
+    def __init__(self, db_path: str = "data/stocks.db", memoize_ids: bool = False,
+                 read_only: bool = False):
         """
         Initialise la connexion à la base de données
         
         Args:
             db_path (str): Chemin vers le fichier .db
+            memoize_ids (bool): Garde en mémoire les ID des actions déjà
+                                lus (symbole -> ID) pour la durée de vie de l'objet
+            read_only (bool): Ouvre la base en lecture seule (mode=ro), pour les
+                              affichages et rapports: ni schéma ni verrou d'écriture.
+                              Ignoré si le fichier n'existe pas encore.
         """
         self.db_path = db_path
+        self.read_only = read_only and os.path.exists(db_path)
         self.connection: Optional[sqlite3.Connection] = None
+        self._cur: Optional[sqlite3.Cursor] = None
+        self._tx_depth = 0
+        self._id_cache: Optional[Dict[str, int]] = {} if memoize_ids else None
         
         # Créer le dossier data s'il n'existe pas
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        existed = os.path.exists(db_path) and os.path.getsize(db_path) > 0
         
         # Se connecter à la base de données
         self._connect()
         
-        # Créer les tables si elles n'existent pas
-        self.create_tables()
+        if self.read_only:
+            self.connection.executescript(_READ_PRAGMAS_SQL)
+        elif existed and self._schema_ready():
+            # Base déjà initialisée: seuls les PRAGMA sont appliqués
+            self.connection.executescript(_PRAGMAS_SQL)
+        else:
+            # Créer les tables si elles n'existent pas
+            self.create_tables()
     
     def _connect(self):
         """
         Établit la connexion à la base de données SQLite
         """
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.execute("PRAGMA foreign_keys = ON")
-            print(f"Connexion établie à la base de données: {self.db_path}")
+            # detect_types=0 et pas de row_factory: lignes en tuples natifs,
+            # sans conversion de type par colonne
+            if self.read_only:
+                database, uri = f"file:{self.db_path}?mode=ro", True
+            else:
+                database, uri = self.db_path, False
+            self.connection = sqlite3.connect(
+                database, detect_types=0,
+                cached_statements=256, uri=uri
+            )
+            # Curseur réutilisé par les requêtes de lecture fréquentes
+            self._cur = self.connection.cursor()
+            logger.debug("Connexion établie à la base de données: %s", self.db_path)
         except sqlite3.Error as e:
-            print(f"Erreur de connexion à la base de données: {e}")
+            logger.error("Erreur de connexion à la base de données: %s", e)
             raise
     
+    def _schema_ready(self) -> bool:
+        """Indique si toutes les tables (et la vue) du schéma existent déjà"""
+        placeholders = ",".join("?" * len(_SCHEMA_OBJECTS))
+        count = self._cur.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",
+            _SCHEMA_OBJECTS
+        ).fetchone()[0]
+        return count == len(_SCHEMA_OBJECTS)
+    
     def create_tables(self):
         """
         Crée toutes les tables nécessaires à partir du fichier schema.sql
+        
+        Les PRAGMA de la connexion sont appliqués dans le même script.
         """
+        if _SCHEMA_SQL is None:
+            logger.warning("Fichier schema.sql non trouvé, création manuelle des tables...")
+            self.connection.executescript(_PRAGMAS_SQL)
+            self._create_tables_manually()
+            return
+        
         try:
-            # Lire le fichier schema.sql
-            schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-            
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                schema_sql = f.read()
-            
-            # Exécuter le script SQL
-            self.connection.executescript(schema_sql)
+            # PRAGMA + schéma (lu une fois au chargement du module)
+            self.connection.executescript(_STARTUP_SQL)
             self.connection.commit()
-            print("Tables créées avec succès")
+            self._analyze_once()
+            logger.debug("Tables créées avec succès")
             
-        except FileNotFoundError:
-            print("Fichier schema.sql non trouvé, création manuelle des tables...")
-            self._create_tables_manually()
         except sqlite3.Error as e:
-            print(f"Erreur lors de la création des tables: {e}")
+            logger.error("Erreur lors de la création des tables: %s", e)
             raise
     
+    def _analyze_once(self):
+        """
+        Lance ANALYZE si la base n'a encore aucune statistique
+        
+        Le planificateur choisit alors l'index UNIQUE(stock_id, date) pour
+        les lectures d'historique; PRAGMA optimize (à la fermeture) se
+        charge ensuite de rafraîchir ces statistiques.
+        """
+        has_stats = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self.connection.execute("ANALYZE")
+            self.connection.commit()
+    
     def _create_tables_manually(self):
         """
         Crée les tables manuellement si schema.sql n'est pas trouvé
@@ -104,12 +276,59 @@ class DatabaseManager:
         """)
         
         self.connection.commit()
-        print("Tables créées manuellement")
+        self._analyze_once()
+        logger.debug("Tables créées manuellement")
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Regroupe plusieurs écritures dans une seule transaction
+        
+        Un seul COMMIT (donc un seul fsync) à la sortie du bloc, ROLLBACK
+        en cas d'exception. Les blocs imbriqués utilisent un SAVEPOINT:
+        seul le bloc le plus externe valide la transaction.
+        
+        Exemple:
+            with db.transaction():
+                for stock in stocks:
+                    db.insert_stock(stock.symbol, stock.name)
+        
+        Yields:
+            DatabaseManager: self
+        """
+        depth = self._tx_depth
+        savepoint = f"sp_{depth}"
+        if depth == 0:
+            if not self.connection.in_transaction:
+                self.connection.execute("BEGIN")
+        else:
+            self.connection.execute(f"SAVEPOINT {savepoint}")
+        
+        self._tx_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if depth == 0:
+                self.connection.rollback()
+            else:
+                self.connection.execute(f"ROLLBACK TO {savepoint}")
+                self.connection.execute(f"RELEASE {savepoint}")
+            raise
+        else:
+            if depth == 0:
+                self.connection.commit()
+            else:
+                self.connection.execute(f"RELEASE {savepoint}")
+        finally:
+            self._tx_depth -= 1
     
     def insert_stock(self, symbol: str, name: str) -> Optional[int]:
         """
         Insert une nouvelle action dans la base de données
         
+        Si l'action existe déjà, son ID est renvoyé et son nom mis à jour
+        (sauf si le nouveau nom n'est que le symbole).
+        
         Args:
             symbol (str): Symbole boursier
             name (str): Nom de l'entreprise
@@ -117,24 +336,109 @@ class DatabaseManager:
         Returns:
             int: ID de l'action insérée, ou None si erreur
         """
+        symbol = _upper(symbol)
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(
-                "INSERT INTO stocks (symbol, name) VALUES (?, ?)",
-                (symbol.upper(), name)
-            )
-            self.connection.commit()
-            print(f"Action {symbol} ajoutée à la BDD (ID: {cursor.lastrowid})")
-            return cursor.lastrowid
+            with self.transaction():
+                cursor = self.connection.cursor()
+                row = cursor.execute(_SQL_GET_STOCK_ID, (symbol,)).fetchone()
+                if row is None:
+                    cursor.execute(_SQL_INSERT_STOCK, (symbol, name))
+                    stock_id = cursor.lastrowid
+                else:
+                    # L'action existe déjà: seul son nom peut changer
+                    stock_id = row[0]
+                    cursor.execute(_SQL_UPDATE_STOCK_NAME, (name, symbol))
+            logger.debug("Action %s enregistrée dans la BDD (ID: %s)", symbol, stock_id)
+            return stock_id
             
-        except sqlite3.IntegrityError:
-            # L'action existe déjà
-            print(f"Action {symbol} déjà présente dans la BDD")
-            return self.get_stock_id(symbol)
         except sqlite3.Error as e:
-            print(f"Erreur lors de l'insertion: {e}")
+            logger.error("Erreur lors de l'insertion: %s", e)
             return None
     
+    def insert_stocks_bulk(self, pairs: List[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Insert plusieurs actions en une seule transaction
+        
+        Équivalent groupé de insert_stock(): les actions déjà présentes
+        gardent leur ID et leur nom est mis à jour (sauf si le nouveau nom
+        n'est que le symbole).
+        
+        Args:
+            pairs (list): Liste de tuples (symbole, nom)
+            
+        Returns:
+            dict: {SYMBOLE: ID}, vide si erreur
+        """
+        try:
+            ids = self.upsert_stocks_and_ids(pairs, update_names=True)
+            logger.debug("%d action(s) enregistrée(s) dans la BDD", len(ids))
+            return ids
+            
+        except sqlite3.Error as e:
+            logger.error("Erreur lors de l'insertion: %s", e)
+            return {}
+    
+    def upsert_stocks_and_ids(self, pairs: List[Tuple[str, str]],
+                              update_names: bool = False) -> Dict[str, int]:
+        """
+        Crée les actions absentes et renvoie les ID de toutes les actions
+        
+        Une requête SELECT ... WHERE symbol IN (...) lit les ID connus; seules
+        les actions absentes sont insérées (un INSERT ignoré ou un upsert en
+        conflit consomme quand même un ID AUTOINCREMENT). Avec update_names,
+        le nom des actions déjà présentes est mis à jour par un executemany
+        UPDATE.
+        
+        Args:
+            pairs (list): Liste de tuples (symbole, nom)
+            update_names (bool): Met à jour le nom des actions déjà présentes
+                                 (jamais remplacé par le symbole seul)
+            
+        Returns:
+            dict: {SYMBOLE: ID}
+        """
+        if not pairs:
+            return {}
+        
+        rows = [(_upper(symbol), name) for symbol, name in pairs]
+        symbols = [symbol for symbol, _ in rows]
+        
+        with self.transaction():
+            cursor = self.connection.cursor()
+            ids = self._select_stock_ids(cursor, symbols)
+            new_names: Dict[str, str] = {}
+            for symbol, name in rows:
+                # Un vrai nom l'emporte sur le symbole seul
+                if symbol not in ids and new_names.get(symbol, symbol) == symbol:
+                    new_names[symbol] = name
+            new_rows = list(new_names.items())
+            if update_names:
+                cursor.executemany(
+                    _SQL_UPDATE_STOCK_NAME,
+                    [(name, symbol) for symbol, name in rows if symbol in ids]
+                )
+            if new_rows:
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO stocks (symbol, name) VALUES (?, ?)",
+                    new_rows
+                )
+                ids.update(self._select_stock_ids(cursor, list(new_names)))
+        
+        # Pas de mémorisation dans une transaction englobante (annulable)
+        if self._id_cache is not None and self._tx_depth == 0:
+            self._id_cache.update(ids)
+        return ids
+    
+    @staticmethod
+    def _select_stock_ids(cursor: sqlite3.Cursor, symbols: List[str]) -> Dict[str, int]:
+        """ID des actions présentes parmi `symbols`, en une seule requête"""
+        placeholders = ",".join("?" * len(symbols))
+        cursor.execute(
+            f"SELECT symbol, id FROM stocks WHERE symbol IN ({placeholders})",
+            symbols
+        )
+        return dict(cursor.fetchall())
+    
     def get_stock_id(self, symbol: str) -> Optional[int]:
         """
         Récupère l'ID d'une action par son symbole
@@ -145,13 +449,17 @@ class DatabaseManager:
         Returns:
             int: ID de l'action, ou None si non trouvée
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "SELECT id FROM stocks WHERE symbol = ?",
-            (symbol.upper(),)
-        )
-        result = cursor.fetchone()
-        return result[0] if result else None
+        symbol = _upper(symbol)
+        if self._id_cache is not None and symbol in self._id_cache:
+            return self._id_cache[symbol]
+        
+        result = self._cur.execute(_SQL_GET_STOCK_ID, (symbol,)).fetchone()
+        if result is None:
+            return None
+        
+        if self._id_cache is not None:
+            self._id_cache[symbol] = result[0]
+        return result[0]
     
     def insert_stock_price(self, symbol: str, date_value: date, 
                           opening: float, closing: float,
@@ -173,27 +481,68 @@ class DatabaseManager:
         """
         stock_id = self.get_stock_id(symbol)
         if stock_id is None:
-            print(f"Action {symbol} non trouvée dans la BDD")
+            logger.warning("Action %s non trouvée dans la BDD", symbol)
             return False
         
+        # ID déjà connu: une seule instruction, sans passer par l'upsert des actions
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO stock_prices 
-                (stock_id, date, opening_price, closing_price, highest_price, lowest_price, volume)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (stock_id, date_value, opening, closing, high, low, volume))
+            with self.transaction():
+                cursor = self.connection.execute(
+                    _SQL_INSERT_PRICE,
+                    (stock_id, date_value, opening, closing, high, low, volume)
+                )
+        except sqlite3.Error as e:
+            logger.error("Erreur lors de l'insertion des prix: %s", e)
+            return False
+        
+        if cursor.rowcount == 0:
+            # Données déjà présentes pour cette date
+            logger.debug("Données déjà présentes pour %s le %s", symbol, date_value)
+        return cursor.rowcount > 0
+    
+    def insert_stock_prices_bulk(self, symbol_to_rows: Dict[str, List[Tuple]],
+                                 names: Optional[Dict[str, str]] = None) -> int:
+        """
+        Insère en une seule transaction les prix de plusieurs actions
+        
+        Les actions absentes sont d'abord créées et tous les ID lus en une
+        requête (upsert_stocks_and_ids); les prix sont insérés avec un seul
+        executemany.
+        Les lignes déjà présentes (même action, même date) sont ignorées.
+        
+        Args:
+            symbol_to_rows (dict): {symbole: [(date, open, close, high, low, volume), ...]}
+            names (dict, optional): {symbole: nom} pour les actions à créer
+                                    (le symbole sert de nom par défaut)
             
-            self.connection.commit()
-            return True
+        Returns:
+            int: Nombre de lignes de prix insérées
+        """
+        if not symbol_to_rows:
+            return 0
+        
+        names = {_upper(symbol): name for symbol, name in (names or {}).items()}
+        symbols = [_upper(symbol) for symbol in symbol_to_rows]
+        
+        try:
+            with self.transaction():
+                # S'assurer que toutes les actions existent, et lire leurs ID
+                ids = self.upsert_stocks_and_ids(
+                    [(symbol, names.get(symbol, symbol)) for symbol in symbols]
+                )
+                
+                cursor = self.connection.cursor()
+                rows = [
+                    (ids[_upper(symbol)], *row)
+                    for symbol, symbol_rows in symbol_to_rows.items()
+                    for row in symbol_rows
+                ]
+                cursor.executemany(_SQL_INSERT_PRICE, rows)
+                return cursor.rowcount
             
-        except sqlite3.IntegrityError:
-            # Données déjà présentes pour cette date
-            print(f"Données déjà présentes pour {symbol} le {date_value}")
-            return False
         except sqlite3.Error as e:
-            print(f"Erreur lors de l'insertion des prix: {e}")
-            return False
+            logger.error("Erreur lors de l'insertion des prix: %s", e)
+            return 0
     
     def get_stock_history(self, symbol: str, 
                          start_date: Optional[date] = None,
@@ -236,6 +585,28 @@ class DatabaseManager:
         cursor.execute(query, params)
         return cursor.fetchall()
     
+    def get_stock_history_arrays(self, symbol: str,
+                                 start_date: Optional[date] = None,
+                                 end_date: Optional[date] = None) -> np.ndarray:
+        """
+        Récupère l'historique des prix d'une action en tableau NumPy
+        
+        Même requête que get_stock_history(), mais les lignes sont converties
+        en un seul tableau structuré: hist['close'] peut être passé directement
+        à Analyzer / TechnicalIndicators (argument closes_np).
+        
+        Args:
+            symbol (str): Symbole boursier
+            start_date (date, optional): Date de début
+            end_date (date, optional): Date de fin
+            
+        Returns:
+            ndarray: Tableau structuré (date, open, close, high, low, volume),
+                     vide si l'action est inconnue
+        """
+        rows = self.get_stock_history(symbol, start_date, end_date)
+        return np.array(rows, dtype=_HISTORY_DTYPE)
+    
     def get_latest_price(self, symbol: str) -> Optional[Tuple]:
         """
         Récupère le dernier prix enregistré pour une action
@@ -250,16 +621,7 @@ class DatabaseManager:
         if stock_id is None:
             return None
         
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT date, opening_price, closing_price, highest_price, lowest_price, volume
-            FROM stock_prices
-            WHERE stock_id = ?
-            ORDER BY date DESC
-            LIMIT 1
-        """, (stock_id,))
-        
-        return cursor.fetchone()
+        return self._cur.execute(_SQL_GET_LATEST_PRICE, (stock_id,)).fetchone()
     
     def get_all_stocks(self) -> List[Tuple]:
         """
@@ -268,20 +630,58 @@ class DatabaseManager:
         Returns:
             List[Tuple]: Liste de tuples (id, symbol, name)
         """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT id, symbol, name FROM stocks ORDER BY symbol")
-        return cursor.fetchall()
+        return self._cur.execute(_SQL_GET_ALL_STOCKS).fetchall()
+    
+    def get_latest_prices_all(self) -> List[Tuple]:
+        """
+        Récupère en une seule requête le dernier prix de chaque action
+        
+        Évite un appel à get_latest_price() par action. Les actions sans
+        prix enregistré ne sont pas renvoyées.
+        
+        Returns:
+            List[Tuple]: Liste de tuples (symbol, name, date, open, close, high, low, volume)
+        """
+        return self._cur.execute(_SQL_GET_LATEST_PRICES_ALL).fetchall()
+    
+    def get_all_stocks_with_latest_price(self) -> List[Tuple]:
+        """
+        Récupère toutes les actions et leur dernier prix en une seule requête
+        
+        Remplace get_all_stocks() suivi de get_latest_price() (ou de
+        get_latest_prices_all()) pour afficher la liste des actions.
+        
+        Returns:
+            List[Tuple]: Liste de tuples (id, symbol, name, date, open, close,
+                         high, low, volume); les colonnes de prix valent None
+                         pour une action sans prix enregistré
+        """
+        return self._cur.execute(_SQL_GET_ALL_STOCKS_WITH_LATEST).fetchall()
     
     def close_connection(self):
         """
         Ferme proprement la connexion à la base de données
         """
         if self.connection:
+            try:
+                # Met à jour les statistiques du planificateur si besoin
+                self.connection.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.connection.close()
-            print("Connexion à la base de données fermée")
+            self.connection = None
+            self._cur = None
+            logger.debug("Connexion à la base de données fermée")
     
-    def __del__(self):
+    def __enter__(self) -> "DatabaseManager":
         """
-        Destructeur: ferme la connexion automatiquement
+        Permet d'utiliser le gestionnaire dans un bloc with:
+        
+            with DatabaseManager() as db:
+                db.get_all_stocks()
         """
-        self.close_connection()
\ No newline at end of file
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Ferme la connexion (PRAGMA optimize compris) à la sortie du bloc"""
+        self.close_connection()
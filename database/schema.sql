@@ -46,6 +46,8 @@ CREATE TABLE IF NOT EXISTS portfolio_stocks (
 );
 
 -- Index pour améliorer les performances des requêtes fréquentes
+-- (la contrainte UNIQUE(stock_id, date) crée déjà l'index composite
+--  utilisé par les lectures d'historique: WHERE stock_id = ? ORDER BY date)
 CREATE INDEX IF NOT EXISTS idx_stock_prices_date ON stock_prices(date);
 CREATE INDEX IF NOT EXISTS idx_stock_prices_stock_id ON stock_prices(stock_id);
 CREATE INDEX IF NOT EXISTS idx_portfolio_stocks_portfolio ON portfolio_stocks(portfolio_id);
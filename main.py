@@ -3,8 +3,13 @@
 Trading Analyzer - Application principale
 Point d'entree du programme
 """
+import functools
+import logging
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
 
 # Ajouter le repertoire courant au path pour les imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -15,10 +20,187 @@ from models.portfolio import Portfolio
 from database.db_manager import DatabaseManager
 from analysis.statistics import Analyzer
 from analysis.indicators import TechnicalIndicators
-from visualization.charts import ChartGenerator
-from reports.pdf_generator import PDFGenerator
+from analysis.bundle import build_bundle
 from datetime import datetime, date
-from reportlab.lib.units import cm
+from typing import Optional
+
+
+@dataclass
+class AppState:
+    """
+    Etat de l'application partage entre les options du menu
+    
+    Attributes:
+        portfolio (Portfolio): Portfolio cree par l'option 3 (None avant)
+        db (DatabaseManager): Connexion a la base, ouverte a la premiere
+                              utilisation et gardee jusqu'a la fin du programme
+    """
+    portfolio: Optional[Portfolio] = None
+    db: Optional[DatabaseManager] = None
+    
+    def get_db(self) -> DatabaseManager:
+        """
+        Renvoie la connexion de la session, ouverte une seule fois
+        
+        Les options 1 et 2 reutilisent la meme connexion (et ses requetes
+        deja preparees) au lieu d'en ouvrir une a chaque appel.
+        """
+        if self.db is None:
+            self.db = DatabaseManager()
+        return self.db
+    
+    def close(self):
+        """Ferme la connexion de la session si elle a ete ouverte"""
+        if self.db is not None:
+            self.db.close_connection()
+            self.db = None
+
+
+@functools.lru_cache(maxsize=1)
+def get_fetcher() -> DataFetcher:
+    """
+    DataFetcher partage par toutes les options du menu
+    
+    Son cache (prix, historiques, noms) est ainsi conserve d'une option
+    a l'autre: les options 4 et 5 reutilisent les historiques deja telecharges.
+    """
+    return DataFetcher()
+
+
+def fetch_histories(fetcher: DataFetcher, symbols, period: str = "3mo") -> dict:
+    """
+    Telecharge l'historique de plusieurs actions en une seule requete
+    
+    DataFetcher.fetch_histories: un seul appel yf.download groupe pour tous
+    les symboles, ceux qu'il n'a pas renvoyes sont redemandes en parallele
+    avec aiohttp. L'ordre des symboles est conserve et les actions sans
+    donnees sont ignorees.
+    
+    Returns:
+        dict: {symbole: DataFrame}
+    """
+    symbols = list(symbols)
+    hists = fetcher.fetch_histories(symbols, period=period)
+    return {symbol: hists[symbol.upper()] for symbol in symbols if symbol.upper() in hists}
+
+
+# Indicateurs deja calcules: {(symbole, periode): SymbolBundle}
+_bundles_cache = {}
+
+
+def build_portfolio_artifacts(portfolio: Portfolio, period: str = "3mo") -> dict:
+    """
+    Historique et indicateurs (MA 20 jours, stats, RSI...) de chaque action
+    
+    Pipeline commun aux graphiques (option 4) et au rapport PDF (option 5).
+    Un SymbolBundle deja calcule est reutilise tant que le DataFetcher
+    renvoie le meme historique (memes valeurs, servies par son cache; le
+    DataFetcher renvoie des copies): enchainer les options 4 et 5 ne refait
+    ni les requetes ni les calculs.
+    
+    Returns:
+        dict: {symbole: SymbolBundle}, dans l'ordre du portfolio
+    """
+    hists = fetch_histories(get_fetcher(), (stock.symbol for stock in portfolio.stocks), period)
+    
+    bundles = {}
+    for symbol, hist in hists.items():
+        bundle = _bundles_cache.get((symbol, period))
+        if bundle is None or not bundle.df.equals(hist):
+            bundle = build_bundle(symbol, hist, window=20)
+            _bundles_cache[(symbol, period)] = bundle
+        bundles[symbol] = bundle
+    return bundles
+
+
+# ChartGenerator du processus de rendu: cree une fois (_init_chart_worker),
+# ses figures sont videes et reutilisees d'un graphique a l'autre
+_worker_chart_gen = None
+
+
+def _get_worker_chart_gen():
+    """ChartGenerator du processus courant, cree au premier appel"""
+    global _worker_chart_gen
+    if _worker_chart_gen is None:
+        from visualization.charts import ChartGenerator
+        _worker_chart_gen = ChartGenerator()
+    return _worker_chart_gen
+
+
+def _render_symbol_chart(symbol: str, name: str, hist, ma, window: int = 20) -> str:
+    """
+    Cree et sauvegarde le graphique prix + moyenne mobile d'une action
+    
+    Fonction de niveau module pour pouvoir etre executee dans un processus
+    fils (ProcessPoolExecutor): le rendu matplotlib est limite par le GIL.
+    
+    Returns:
+        str: Chemin du fichier PNG
+    """
+    chart_gen = _get_worker_chart_gen()
+    fig = chart_gen.create_price_with_ma(
+        hist, ma,
+        f"Prix de {name} avec MA({window})",
+        window=window
+    )
+    return chart_gen.save_chart(fig, f"{symbol}_prix_ma.png")
+
+
+def _render_report_chart(symbol: str, hist, ma, window: int = 20, dpi: int = 80) -> bytes:
+    """
+    Cree le graphique prix + moyenne mobile d'une action pour le rapport PDF
+    
+    Comme _render_symbol_chart, executable dans un processus fils; l'image
+    est renvoyee en PNG (bytes) au lieu d'etre ecrite dans data/exports.
+    
+    Returns:
+        bytes: Image PNG
+    """
+    chart_gen = _get_worker_chart_gen()
+    fig = chart_gen.create_price_with_ma(
+        hist, ma,
+        f"Prix de {symbol} avec Moyenne Mobile ({window}j)",
+        window=window
+    )
+    return chart_gen.save_chart_buf(fig, dpi=dpi).getvalue()
+
+
+def _init_chart_worker():
+    """
+    Backend sans affichage (Agg) dans les processus de rendu des graphiques
+    
+    Le ChartGenerator du processus (et donc matplotlib.pyplot) est cree des
+    le demarrage, pas au premier graphique; toutes les taches du processus
+    le partagent et reutilisent sa figure.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    _get_worker_chart_gen()
+
+
+def _start_chart_pool(n_charts: int) -> Optional[ProcessPoolExecutor]:
+    """
+    Demarre les processus de rendu avant le telechargement des historiques
+    
+    Une tache vide par processus force leur creation tout de suite: leur
+    lancement et l'import de matplotlib se font pendant l'attente reseau,
+    au lieu de s'ajouter au temps de rendu.
+    
+    Args:
+        n_charts (int): Nombre de graphiques a rendre
+    
+    Returns:
+        ProcessPoolExecutor: Pool a fermer avec shutdown(), ou None s'il n'y a
+                             qu'un graphique (rendu dans le processus principal)
+    """
+    if n_charts <= 1:
+        return None
+    
+    workers = min(os.cpu_count() or 1, n_charts)
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_chart_worker)
+    for _ in range(workers):
+        executor.submit(int)
+    return executor
 
 
 def afficher_menu():
@@ -35,7 +217,7 @@ def afficher_menu():
     print("=" * 70)
 
 
-def analyser_action():
+def analyser_action(state: AppState):
     """Analyse une action en temps reel avec l'API"""
     print("\n" + "=" * 70)
     print("ANALYSE D'ACTION EN TEMPS REEL")
@@ -51,7 +233,7 @@ def analyser_action():
     
     try:
         # Initialiser le fetcher
-        fetcher = DataFetcher()
+        fetcher = get_fetcher()
         
         # Recuperer le stock
         stock = fetcher.create_stock_from_api(symbol)
@@ -117,20 +299,19 @@ def analyser_action():
             # Proposer de sauvegarder en BDD
             save = input("\nSauvegarder cette action en base de donnees ? (o/n): ").lower()
             if save == 'o':
-                db = DatabaseManager()
-                stock_id = db.insert_stock(stock.symbol, stock.name)
-                if stock_id:
-                    db.insert_stock_price(
-                        symbol=stock.symbol,
-                        date_value=date.today(),
-                        opening=stock.opening_price or stock.current_price,
-                        closing=stock.current_price,
-                        high=stock.highest_price or stock.current_price,
-                        low=stock.lowest_price or stock.current_price,
-                        volume=stock.volume or 0
-                    )
-                    print("Action sauvegardee en base de donnees")
-                db.close_connection()
+                # Action et prix du jour en une seule transaction
+                state.get_db().insert_stock_prices_bulk(
+                    {stock.symbol: [(
+                        date.today(),
+                        stock.opening_price or stock.current_price,
+                        stock.current_price,
+                        stock.highest_price or stock.current_price,
+                        stock.lowest_price or stock.current_price,
+                        stock.volume or 0
+                    )]},
+                    names={stock.symbol: stock.name}
+                )
+                print("Action sauvegardee en base de donnees")
         
         else:
             print("Attention: Impossible de recuperer l'historique")
@@ -139,15 +320,17 @@ def analyser_action():
         print(f"Erreur lors de l'analyse: {e}")
 
 
-def afficher_actions_bdd():
+def afficher_actions_bdd(state: AppState):
     """Affiche toutes les actions en base de donnees"""
     print("\n" + "=" * 70)
     print("ACTIONS EN BASE DE DONNEES")
     print("=" * 70)
     
     try:
-        db = DatabaseManager()
-        actions = db.get_all_stocks()
+        # Connexion de la session (ouverte une seule fois)
+        db = state.get_db()
+        # Actions et derniers prix en une seule requete
+        actions = db.get_all_stocks_with_latest_price()
         
         if not actions:
             print("\nAucune action en base de donnees.")
@@ -155,23 +338,18 @@ def afficher_actions_bdd():
         else:
             print(f"\n{len(actions)} action(s) trouvee(s):\n")
             for stock_data in actions:
-                stock_id, symbol, name = stock_data
+                stock_id, symbol, name, date_val, open_p, close_p, high_p, low_p, volume = stock_data
                 print(f"  [{stock_id}] {symbol} - {name}")
                 
-                # Recuperer le dernier prix
-                last_price = db.get_latest_price(symbol)
-                if last_price:
-                    date_val, open_p, close_p, high_p, low_p, volume = last_price
+                if date_val is not None:
                     variation = ((close_p - open_p) / open_p * 100) if open_p > 0 else 0
                     print(f"      Prix: ${close_p:.2f} ({variation:+.2f}%) - {date_val}")
-        
-        db.close_connection()
-        
+    
     except Exception as e:
         print(f"Erreur: {e}")
 
 
-def creer_portfolio_reel():
+def creer_portfolio_reel(state: AppState):
     """Cree un portfolio avec donnees reelles de l'API"""
     print("\n" + "=" * 70)
     print("CREATION DE PORTFOLIO AVEC DONNEES REELLES")
@@ -188,7 +366,9 @@ def creer_portfolio_reel():
     print("Exemples: AAPL, GOOGL, MSFT, TSLA, AMZN")
     print("Tapez 'fin' pour terminer\n")
     
-    fetcher = DataFetcher()
+    fetcher = get_fetcher()
+    # Actions ajoutees en une seule fois a la fin de la saisie
+    new_stocks = []
     
     while True:
         symbol = input("Symbole (ou 'fin'): ").upper().strip()
@@ -202,7 +382,7 @@ def creer_portfolio_reel():
             stock = fetcher.create_stock_from_api(symbol)
             
             if stock:
-                portfolio.add_stock(stock)
+                new_stocks.append(stock)
                 print(f"OK: {stock.name}: ${stock.current_price:.2f} ({stock.get_variation():+.2f}%)")
             else:
                 print(f"Erreur: Action '{symbol}' introuvable")
@@ -210,6 +390,8 @@ def creer_portfolio_reel():
         except Exception as e:
             print(f"Erreur: {e}")
     
+    portfolio.add_stocks(new_stocks)
+    
     # Afficher le resume
     if portfolio.get_stocks_count() > 0:
         print("\n" + "-" * 70)
@@ -224,34 +406,33 @@ def creer_portfolio_reel():
         
         best = portfolio.get_best_performer()
         worst = portfolio.get_worst_performer()
+        variations = portfolio.get_variations()
         
         if best:
-            print(f"\nMeilleure performance: {best.symbol} ({best.get_variation():+.2f}%)")
+            print(f"\nMeilleure performance: {best.symbol} ({variations[best.symbol]:+.2f}%)")
         if worst:
-            print(f"Moins bonne performance: {worst.symbol} ({worst.get_variation():+.2f}%)")
+            print(f"Moins bonne performance: {worst.symbol} ({variations[worst.symbol]:+.2f}%)")
         
         # Sauvegarder le portfolio pour utilisation ulterieure
-        global current_portfolio
-        current_portfolio = portfolio
+        state.portfolio = portfolio
         print("\nPortfolio sauvegarde en memoire pour les options 4 et 5")
     else:
         print("\nPortfolio vide")
 
 
-def creer_visualisations():
+def creer_visualisations(state: AppState):
     """Cree des graphiques pour les actions"""
     print("\n" + "=" * 70)
     print("CREATION DE VISUALISATIONS")
     print("=" * 70)
     
     # Verifier si un portfolio existe
-    if 'current_portfolio' not in globals() or current_portfolio is None:
+    portfolio = state.portfolio
+    if portfolio is None:
         print("\nAucun portfolio en memoire.")
         print("Conseil: Utilisez d'abord l'option 3 pour creer un portfolio")
         return
     
-    portfolio = current_portfolio
-    
     if portfolio.get_stocks_count() == 0:
         print("\nLe portfolio est vide.")
         return
@@ -269,7 +450,10 @@ def creer_visualisations():
     choix = input("\nVotre choix (1-4): ").strip()
     
     try:
-        fetcher = DataFetcher()
+        # Import differe: matplotlib n'est charge que pour les graphiques
+        from visualization.charts import ChartGenerator
+        
+        fetcher = get_fetcher()
         chart_gen = ChartGenerator()
         os.makedirs('data/exports', exist_ok=True)
         
@@ -321,13 +505,9 @@ def creer_visualisations():
         elif choix == '3':
             # Comparaison de plusieurs actions
             print("\nRecuperation de l'historique pour toutes les actions...")
-            stocks_data = {}
-            
-            for stock in portfolio.stocks:
-                hist = fetcher.fetch_historical_data(stock.symbol, period="3mo")
-                if hist is not None and not hist.empty:
-                    stocks_data[stock.symbol] = hist
-                    print(f"  OK: {stock.symbol}")
+            stocks_data = fetch_histories(fetcher, (stock.symbol for stock in portfolio.stocks))
+            for symbol in stocks_data:
+                print(f"  OK: {symbol}")
             
             if len(stocks_data) > 0:
                 fig = chart_gen.create_comparison_chart(
@@ -343,37 +523,44 @@ def creer_visualisations():
             # Tous les graphiques
             print("\nCreation de tous les graphiques...")
             
-            # 1. Comparaison
-            print("\n1. Graphique de comparaison...")
-            stocks_data = {}
-            for stock in portfolio.stocks:
-                hist = fetcher.fetch_historical_data(stock.symbol, period="3mo")
-                if hist is not None and not hist.empty:
-                    stocks_data[stock.symbol] = hist
-            
-            if len(stocks_data) > 0:
-                fig = chart_gen.create_comparison_chart(
-                    stocks_data,
-                    f"Comparaison du portfolio {portfolio.name}"
-                )
-                chart_gen.save_chart(fig, "comparaison_portfolio.png")
-                print("   Sauvegarde: data/exports/comparaison_portfolio.png")
-            
-            # 2. Graphiques individuels avec MA
-            print("\n2. Graphiques individuels avec moyenne mobile...")
-            for stock in portfolio.stocks:
-                hist = fetcher.fetch_historical_data(stock.symbol, period="3mo")
-                if hist is not None and not hist.empty:
-                    analyzer = Analyzer(hist)
-                    ma = analyzer.calculate_moving_average(20)
-                    
-                    fig = chart_gen.create_price_with_ma(
-                        hist, ma,
-                        f"Prix de {stock.name} avec MA(20)",
-                        window=20
+            # Un processus par graphique individuel (rendu en parallele sur
+            # plusieurs coeurs), demarre pendant le telechargement
+            executor = _start_chart_pool(portfolio.get_stocks_count())
+            try:
+                bundles = build_portfolio_artifacts(portfolio)
+                stocks_data = {symbol: bundle.df for symbol, bundle in bundles.items()}
+                
+                # Graphiques individuels avec MA soumis d'abord: les processus
+                # les rendent pendant que la comparaison est dessinee ici
+                symbols = list(bundles)
+                names = [portfolio.get_stock(symbol).name for symbol in symbols]
+                hists = [bundles[symbol].df for symbol in symbols]
+                mas = [bundles[symbol].ma for symbol in symbols]
+                
+                if executor is not None:
+                    paths = executor.map(_render_symbol_chart, symbols, names, hists, mas)
+                else:
+                    paths = map(_render_symbol_chart, symbols, names, hists, mas)
+                
+                # 1. Comparaison
+                print("\n1. Graphique de comparaison...")
+                if len(stocks_data) > 0:
+                    fig = chart_gen.create_comparison_chart(
+                        stocks_data,
+                        f"Comparaison du portfolio {portfolio.name}"
                     )
-                    chart_gen.save_chart(fig, f"{stock.symbol}_prix_ma.png")
-                    print(f"   Sauvegarde: data/exports/{stock.symbol}_prix_ma.png")
+                    chart_gen.save_chart(fig, "comparaison_portfolio.png")
+                    print("   Sauvegarde: data/exports/comparaison_portfolio.png")
+                
+                # 2. Graphiques individuels avec MA
+                print("\n2. Graphiques individuels avec moyenne mobile...")
+                paths = list(paths)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            
+            for path in paths:
+                print(f"   Sauvegarde: {path}")
             
             print("\nTous les graphiques ont ete crees avec succes!")
         
@@ -388,20 +575,19 @@ def creer_visualisations():
         traceback.print_exc()
 
 
-def generer_rapport_pdf():
+def generer_rapport_pdf(state: AppState):
     """Genere un rapport PDF avec les actions du portfolio"""
     print("\n" + "=" * 70)
     print("GENERATION DE RAPPORT PDF")
     print("=" * 70)
     
     # Verifier si un portfolio existe
-    if 'current_portfolio' not in globals() or current_portfolio is None:
+    portfolio = state.portfolio
+    if portfolio is None:
         print("\nAucun portfolio en memoire.")
         print("Conseil: Utilisez d'abord l'option 3 pour creer un portfolio")
         return
     
-    portfolio = current_portfolio
-    
     if portfolio.get_stocks_count() == 0:
         print("\nLe portfolio est vide.")
         return
@@ -413,55 +599,64 @@ def generer_rapport_pdf():
     print("Cela peut prendre 30-60 secondes...")
     
     try:
+        # Imports differes: matplotlib et ReportLab ne sont charges que
+        # pour les options qui en ont besoin (demarrage plus rapide)
+        from visualization.charts import ChartGenerator
+        from reports.pdf_generator import PDFGenerator
+        from reportlab.lib.units import cm
+        
         os.makedirs('data/exports', exist_ok=True)
         
-        fetcher = DataFetcher()
         chart_gen = ChartGenerator()
         
-        # 1. Recuperer les donnees
-        print("\n[1/3] Recuperation des donnees...")
-        stocks_history = {}
-        
-        for stock in portfolio.stocks:
-            print(f"  Recuperation de {stock.symbol}...")
-            hist = fetcher.fetch_historical_data(stock.symbol, period="3mo")
-            if hist is not None and not hist.empty:
-                stocks_history[stock.symbol] = hist
-        
-        print(f"  OK: {len(stocks_history)} actions recuperees")
-        
-        # 2. Creer les graphiques
-        print("\n[2/3] Creation des graphiques...")
-        graph_files = []
-        
-        # Graphique de comparaison
-        if len(stocks_history) > 1:
-            print("  Creation graphique de comparaison...")
-            fig = chart_gen.create_comparison_chart(
-                stocks_history,
-                "Comparaison des performances (3 mois)"
-            )
-            chart_gen.save_chart(fig, "rapport_comparaison.png")
-            graph_files.append("data/exports/rapport_comparaison.png")
-        
-        # Graphiques individuels
-        for symbol in stocks_history.keys():
-            print(f"  Creation graphique pour {symbol}...")
-            hist = stocks_history[symbol]
-            analyzer = Analyzer(hist)
-            ma = analyzer.calculate_moving_average(20)
+        # Processus de rendu (un par graphique individuel) demarres pendant
+        # le telechargement des historiques
+        executor = _start_chart_pool(portfolio.get_stocks_count())
+        try:
+            # 1. Recuperer les donnees
+            print("\n[1/3] Recuperation des donnees...")
+            print(f"  Recuperation de {', '.join(stock.symbol for stock in portfolio.stocks)}...")
+            # Indicateurs calcules une seule fois par action (et reutilises si
+            # les graphiques de l'option 4 viennent d'etre crees), partages par
+            # les graphiques et par les analyses detaillees
+            bundles = build_portfolio_artifacts(portfolio)
+            stocks_history = {symbol: bundle.df for symbol, bundle in bundles.items()}
+            
+            print(f"  OK: {len(stocks_history)} actions recuperees")
+            
+            # 2. Creer les graphiques (PNG en memoire, sans fichiers intermediaires)
+            print("\n[2/3] Creation des graphiques...")
+            graph_bufs = []
+            
+            # Graphiques individuels soumis d'abord aux processus, rendus
+            # pendant la comparaison (map conserve l'ordre du portfolio,
+            # repris par les sections du PDF)
+            symbols = list(stocks_history)
+            hists = [bundles[symbol].df for symbol in symbols]
+            mas = [bundles[symbol].ma for symbol in symbols]
+            print(f"  Creation des graphiques pour {', '.join(symbols)}...")
+            
+            if executor is not None:
+                pngs = executor.map(_render_report_chart, symbols, hists, mas)
+            else:
+                pngs = map(_render_report_chart, symbols, hists, mas)
             
-            fig = chart_gen.create_price_with_ma(
-                hist, ma,
-                f"Prix de {symbol} avec Moyenne Mobile (20j)",
-                window=20
-            )
-            filename = f"rapport_{symbol.lower()}.png"
-            chart_gen.save_chart(fig, filename)
-            graph_files.append(f"data/exports/{filename}")
+            # Graphique de comparaison
+            if len(stocks_history) > 1:
+                print("  Creation graphique de comparaison...")
+                fig = chart_gen.create_comparison_chart(
+                    stocks_history,
+                    "Comparaison des performances (3 mois)"
+                )
+                graph_bufs.append(chart_gen.save_chart_buf(fig, dpi=80))
+            
+            graph_bufs.extend(BytesIO(png) for png in pngs)
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         chart_gen.close_all()
-        print(f"  OK: {len(graph_files)} graphiques crees")
+        print(f"  OK: {len(graph_bufs)} graphiques crees")
         
         # 3. Generer le PDF
         print("\n[3/3] Generation du PDF...")
@@ -483,23 +678,24 @@ def generer_rapport_pdf():
         
         # Tableau des actions
         table_data = [['Symbole', 'Nom', 'Prix actuel', 'Variation']]
+        variations = portfolio.get_variations()
         for stock in portfolio.stocks:
             table_data.append([
                 stock.symbol,
                 stock.name[:30],
                 f"${stock.current_price:.2f}",
-                f"{stock.get_variation():+.2f}%"
+                f"{variations[stock.symbol]:+.2f}%"
             ])
         
         pdf.add_table(table_data, col_widths=[3*cm, 7*cm, 3*cm, 3*cm])
         
         # Section 2: Comparaison
-        if len(graph_files) > 0 and len(stocks_history) > 1:
+        if len(graph_bufs) > 0 and len(stocks_history) > 1:
             pdf.add_page_break()
             pdf.add_heading("2. Comparaison des Performances")
             pdf.add_text("Les prix sont normalises (base 100) pour faciliter la comparaison.")
             pdf.add_spacer()
-            pdf.add_image(graph_files[0], width=10*cm, height=7*cm)
+            pdf.add_image(graph_bufs[0], width=10*cm, height=7*cm)
         
         # Section 3: Analyses detaillees
         pdf.add_page_break()
@@ -513,36 +709,30 @@ def generer_rapport_pdf():
             
             pdf.add_spacer(0.3*cm)
             
-            hist = stocks_history[symbol]
-            analyzer = Analyzer(hist)
-            indicators = TechnicalIndicators(hist)
+            bundle = bundles[symbol]
             
             # Statistiques
-            stats = analyzer.get_statistics()
+            stats = bundle.stats
             pdf.add_text(f"Prix moyen (3 mois): ${stats['prix_moyen']:.2f}")
             pdf.add_text(f"Prix minimum: ${stats['prix_min']:.2f}")
             pdf.add_text(f"Prix maximum: ${stats['prix_max']:.2f}")
             
-            vol = analyzer.calculate_volatility()
-            if vol:
-                pdf.add_text(f"Volatilite: {vol:.2f}%")
+            if bundle.volatility:
+                pdf.add_text(f"Volatilite: {bundle.volatility:.2f}%")
             
-            trend = analyzer.calculate_trend()
-            pdf.add_text(f"Tendance: {trend}")
+            pdf.add_text(f"Tendance: {bundle.trend}")
             
-            rsi = indicators.calculate_rsi()
-            if rsi:
-                pdf.add_text(f"RSI (14 jours): {rsi:.2f}")
+            if bundle.rsi:
+                pdf.add_text(f"RSI (14 jours): {bundle.rsi:.2f}")
             
-            signal = indicators.get_simple_signal()
-            pdf.add_text(f"Signal de trading: {signal}")
+            pdf.add_text(f"Signal de trading: {bundle.signal}")
             
             pdf.add_spacer()
             
             # Graphique
             graph_index = i + (1 if len(stocks_history) > 1 else 0)
-            if graph_index < len(graph_files):
-                pdf.add_image(graph_files[graph_index], width=10*cm, height=7*cm)
+            if graph_index < len(graph_bufs):
+                pdf.add_image(graph_bufs[graph_index], width=10*cm, height=7*cm)
             
             if i < len(stocks_history) - 1:
                 pdf.add_page_break()
@@ -550,6 +740,12 @@ def generer_rapport_pdf():
         # Generer le PDF
         filepath = pdf.generate()
         
+        # Les images ne sont lues qu'a la construction du PDF: les tampons
+        # PNG sont liberes une fois le fichier ecrit
+        for buf in graph_bufs:
+            buf.close()
+        graph_bufs.clear()
+        
         print(f"\nRapport PDF genere avec succes!")
         print(f"Fichier: {filepath}")
         
@@ -566,42 +762,47 @@ def main():
     print("\nTrading Analyzer - Demarrage...")
     print("Version finale - Projet M1 INFO IA DATA")
     
-    # Variable globale pour stocker le portfolio
-    global current_portfolio
-    current_portfolio = None
+    # Etat partage entre les options (portfolio de l'option 3)
+    state = AppState()
     
-    while True:
-        afficher_menu()
-        
-        try:
-            choix = input("\nVotre choix: ").strip()
-            
-            if choix == "1":
-                analyser_action()
-            elif choix == "2":
-                afficher_actions_bdd()
-            elif choix == "3":
-                creer_portfolio_reel()
-            elif choix == "4":
-                creer_visualisations()
-            elif choix == "5":
-                generer_rapport_pdf()
-            elif choix == "0":
-                print("\nAu revoir ! Merci d'avoir utilise Trading Analyzer.")
+    try:
+        while True:
+            afficher_menu()
+            
+            try:
+                choix = input("\nVotre choix: ").strip()
+                
+                if choix == "1":
+                    analyser_action(state)
+                elif choix == "2":
+                    afficher_actions_bdd(state)
+                elif choix == "3":
+                    creer_portfolio_reel(state)
+                elif choix == "4":
+                    creer_visualisations(state)
+                elif choix == "5":
+                    generer_rapport_pdf(state)
+                elif choix == "0":
+                    print("\nAu revoir ! Merci d'avoir utilise Trading Analyzer.")
+                    sys.exit(0)
+                else:
+                    print("\nChoix invalide. Veuillez choisir une option du menu.")
+            
+            except KeyboardInterrupt:
+                print("\n\nInterruption detectee. Au revoir !")
                 sys.exit(0)
-            else:
-                print("\nChoix invalide. Veuillez choisir une option du menu.")
-        
-        except KeyboardInterrupt:
-            print("\n\nInterruption detectee. Au revoir !")
-            sys.exit(0)
-        except Exception as e:
-            print(f"\nErreur: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        input("\n[Appuyez sur Entree pour continuer]")
+            except Exception as e:
+                print(f"\nErreur: {e}")
+                import traceback
+                traceback.print_exc()
+            
+            input("\n[Appuyez sur Entree pour continuer]")
+    finally:
+        # Connexion de la session fermee en quittant (PRAGMA optimize compris)
+        state.close()
 
 
 if __name__ == "__main__":
+    # Messages des modules (api, analysis) affichés dans la console
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
\ No newline at end of file
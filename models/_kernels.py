@@ -0,0 +1,92 @@
+"""
+Module _kernels - Boucles numériques du portefeuille
+
+Compilées avec numba quand il est installé, sinon exécutées en Python pur
+(comme analysis._kernels).
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba est optionnel
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur neutre"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def variation_stats(current: np.ndarray, variations: np.ndarray):
+    """
+    Valeur totale, variation moyenne, meilleure et pire action en un seul parcours
+
+    Les NaN (prix manquant, ouverture à 0) sont ignorés comme avec
+    np.nansum / np.nanmean / np.nanargmax. En cas d'égalité, la première
+    action l'emporte. Pas de fastmath: il supposerait l'absence de NaN.
+
+    Args:
+        current (ndarray): Prix actuels
+        variations (ndarray): Variations en % (même longueur)
+
+    Returns:
+        tuple: (total, moyenne, indice du max, indice du min);
+               moyenne NaN et indices -1 si aucune variation connue
+    """
+    total = 0.0
+    var_sum = 0.0
+    n_var = 0
+    best = -1
+    worst = -1
+    for i in range(current.shape[0]):
+        price = current[i]
+        if not np.isnan(price):
+            total += price
+
+        v = variations[i]
+        if np.isnan(v):
+            continue
+        var_sum += v
+        n_var += 1
+        if best < 0 or v > variations[best]:
+            best = i
+        if worst < 0 or v < variations[worst]:
+            worst = i
+
+    mean = var_sum / n_var if n_var > 0 else np.nan
+    return total, mean, best, worst
+
+
+@njit(cache=True)
+def ledger_total(qty: np.ndarray, price: np.ndarray, fees: np.ndarray, side: np.ndarray) -> float:
+    """
+    Somme des montants nets d'un journal: sens * (quantité * prix + frais)
+
+    Pas de fastmath, comme variation_stats: Transaction ne valide pas les
+    frais, et un prix NaN passe le test "<= 0". Un NaN donne un total NaN.
+
+    Args:
+        qty (ndarray): Quantités
+        price (ndarray): Prix unitaires
+        fees (ndarray): Frais
+        side (ndarray): Sens (-1 achat, +1 vente)
+
+    Returns:
+        float: Flux de trésorerie total
+    """
+    total = 0.0
+    for i in range(qty.shape[0]):
+        total += side[i] * (qty[i] * price[i] + fees[i])
+    return total
+
+
+def warm_up():
+    """
+    Compile tous les noyaux sur de petits tableaux
+
+    Comme analysis._kernels.warm_up(), à appeler au démarrage d'une
+    application longue (Streamlit).
+    """
+    values = np.linspace(1.0, 2.0, 4)
+    variation_stats(values, values)
+    ledger_total(np.ones(4, dtype=np.int64), values, values, np.ones(4, dtype=np.int8))
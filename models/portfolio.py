@@ -1,8 +1,10 @@
 """
 Classe Portfolio - Gestion d'un portefeuille d'actions
 """
-from typing import List, Optional
-from models.stock import Stock
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from models.stock import Stock, _norm_symbol
+from models._kernels import variation_stats
 
 
 class Portfolio:
@@ -23,6 +25,67 @@ class Portfolio:
         """
         self.name = name
         self.stocks: List[Stock] = []
+        
+        # Index symbole -> position dans self.stocks (recherche en O(1))
+        self._index: Dict[str, int] = {}
+        
+        # Vue "structure de tableaux" de self.stocks (même ordre):
+        # symboles, prix actuels et d'ouverture, variations en % (NaN si manquant),
+        # reconstruite après un ajout/retrait ou une mise à jour de prix.
+        self._symbols = np.empty(0, dtype=object)
+        self._current = np.empty(0)
+        self._opening = np.empty(0)
+        self._variations = np.empty(0)
+        # (total, variation moyenne, indice meilleure, indice pire), même version
+        self._stats: Tuple[float, float, int, int] = (0.0, np.nan, -1, -1)
+        self._arrays_version: Optional[int] = None
+    
+    def _invalidate(self):
+        """Marque les tableaux comme à reconstruire"""
+        self._arrays_version = None
+    
+    def _price_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tableaux (prix actuels, variations en %) des actions, dans l'ordre de self.stocks
+        
+        Reconstruits seulement si une action a été ajoutée, retirée ou mise à jour.
+        """
+        if self._arrays_version != Stock._price_version:
+            nan = np.nan
+            self._symbols = np.array([stock.symbol for stock in self.stocks], dtype=object)
+            self._current = np.array(
+                [nan if stock.current_price is None else stock.current_price for stock in self.stocks],
+                dtype=np.float64
+            )
+            self._opening = np.array(
+                [nan if stock.opening_price is None else stock.opening_price for stock in self.stocks],
+                dtype=np.float64
+            )
+            
+            # Même calcul que Stock.get_variation(), sur tout le tableau
+            # (NaN si un prix manque ou si l'ouverture vaut 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                variations = (self._current - self._opening) / self._opening * 100
+            variations[self._opening == 0] = nan
+            self._variations = np.round(variations, 2)
+            
+            # Les 4 agrégats en un seul parcours (noyau compilé)
+            total, mean, best, worst = variation_stats(self._current, self._variations)
+            self._stats = (float(total), float(mean), int(best), int(worst))
+            
+            self._arrays_version = Stock._price_version
+        return self._current, self._variations
+    
+    def _aggregates(self) -> Tuple[float, float, int, int]:
+        """
+        Agrégats calculés avec les tableaux de prix
+        
+        Returns:
+            tuple: (valeur totale, variation moyenne (NaN si inconnue),
+                    indice de la meilleure action, indice de la pire; -1 si aucune)
+        """
+        self._price_arrays()
+        return self._stats
     
     def add_stock(self, stock: Stock) -> bool:
         """
@@ -35,14 +98,43 @@ class Portfolio:
             bool: True si ajouté avec succès, False si déjà présent
         """
         # Vérifier si l'action existe dans le portfolio
-        if self.get_stock(stock.symbol) is not None:
+        if stock.symbol in self._index:
             print(f" L'action {stock.symbol} est déjà dans le portefeuille")
             return False
         
+        self._index[stock.symbol] = len(self.stocks)
         self.stocks.append(stock)
+        self._invalidate()
         print(f" Action {stock.symbol} ajoutée au portefeuille '{self.name}'")
         return True
     
+    def add_stocks(self, stocks: List[Stock]) -> int:
+        """
+        Ajoute plusieurs actions au portefeuille en une fois
+        
+        Les tableaux de prix ne sont invalidés qu'une seule fois, et
+        reconstruits au premier calcul qui en a besoin.
+        
+        Args:
+            stocks (List[Stock]): Les actions à ajouter
+            
+        Returns:
+            int: Nombre d'actions ajoutées (les doublons sont ignorés)
+        """
+        added = 0
+        for stock in stocks:
+            if stock.symbol in self._index:
+                print(f" L'action {stock.symbol} est déjà dans le portefeuille")
+                continue
+            self._index[stock.symbol] = len(self.stocks)
+            self.stocks.append(stock)
+            added += 1
+        
+        if added:
+            self._invalidate()
+            print(f" {added} action(s) ajoutée(s) au portefeuille '{self.name}'")
+        return added
+    
     def remove_stock(self, symbol: str) -> bool:
         """
         Retire une action du portefeuille par son symbole
@@ -53,16 +145,20 @@ class Portfolio:
         Returns:
             bool: True si retiré avec succès, False si non trouvé
         """
-        symbol = symbol.upper()
+        symbol = _norm_symbol(symbol)
         
-        for i, stock in enumerate(self.stocks):
-            if stock.symbol == symbol:
-                removed_stock = self.stocks.pop(i)
-                print(f" Action {removed_stock.symbol} retirée du portefeuille")
-                return True
+        i = self._index.pop(symbol, None)
+        if i is None:
+            print(f" Action {symbol} non trouvée dans le portefeuille")
+            return False
         
-        print(f" Action {symbol} non trouvée dans le portefeuille")
-        return False
+        removed_stock = self.stocks.pop(i)
+        # Les actions suivantes reculent d'une position
+        for j in range(i, len(self.stocks)):
+            self._index[self.stocks[j].symbol] = j
+        self._invalidate()
+        print(f" Action {removed_stock.symbol} retirée du portefeuille")
+        return True
     
     def get_stock(self, symbol: str) -> Optional[Stock]:
         """
@@ -74,13 +170,8 @@ class Portfolio:
         Returns:
             Stock: L'action trouvée, ou None si non trouvée
         """
-        symbol = symbol.upper()
-        
-        for stock in self.stocks:
-            if stock.symbol == symbol:
-                return stock
-        
-        return None
+        i = self._index.get(_norm_symbol(symbol))
+        return self.stocks[i] if i is not None else None
     
     def get_total_value(self) -> float:
         """
@@ -91,12 +182,7 @@ class Portfolio:
         Returns:
             float: Valeur totale du portefeuille
         """
-        total = 0.0
-        
-        for stock in self.stocks:
-            if stock.current_price is not None:
-                total += stock.current_price
-        
+        total, _, _, _ = self._aggregates()
         return round(total, 2)
     
     def get_best_performer(self) -> Optional[Stock]:
@@ -109,16 +195,9 @@ class Portfolio:
         if not self.stocks:
             return None
         
-        best_stock = None
-        best_variation = float('-inf')  # Commence à -infini
-        
-        for stock in self.stocks:
-            variation = stock.get_variation()
-            if variation is not None and variation > best_variation:
-                best_variation = variation
-                best_stock = stock
-        
-        return best_stock
+        # Première action ayant la variation maximale (NaN ignorés)
+        _, _, best, _ = self._aggregates()
+        return self.stocks[best] if best >= 0 else None
     
     def get_worst_performer(self) -> Optional[Stock]:
         """
@@ -130,16 +209,25 @@ class Portfolio:
         if not self.stocks:
             return None
         
-        worst_stock = None
-        worst_variation = float('inf')  # Commence à +infini
+        # Première action ayant la variation minimale (NaN ignorés)
+        _, _, _, worst = self._aggregates()
+        return self.stocks[worst] if worst >= 0 else None
+    
+    def get_variations(self) -> Dict[str, Optional[float]]:
+        """
+        Variations en % de toutes les actions, calculées une seule fois
         
-        for stock in self.stocks:
-            variation = stock.get_variation()
-            if variation is not None and variation < worst_variation:
-                worst_variation = variation
-                worst_stock = stock
+        Les valeurs viennent du tableau déjà utilisé par get_best_performer()
+        et get_worst_performer(): pas de nouvel appel à Stock.get_variation().
         
-        return worst_stock
+        Returns:
+            dict: {symbole: variation en %, ou None si données manquantes}
+        """
+        _, variations = self._price_arrays()
+        return {
+            symbol: None if np.isnan(variation) else float(variation)
+            for symbol, variation in zip(self._symbols, variations)
+        }
     
     def get_stocks_count(self) -> int:
         """
@@ -160,16 +248,11 @@ class Portfolio:
         if not self.stocks:
             return None
         
-        variations = []
-        for stock in self.stocks:
-            var = stock.get_variation()
-            if var is not None:
-                variations.append(var)
-        
-        if not variations:
+        _, mean, _, _ = self._aggregates()
+        if np.isnan(mean):
             return None
         
-        return round(sum(variations) / len(variations), 2)
+        return round(mean, 2)
     
     def to_dict(self) -> dict:
         """
@@ -5,6 +5,16 @@ from datetime import datetime
 from typing import Optional
 
 
+def _norm_symbol(symbol: str) -> str:
+    """
+    Symbole en majuscules, sans nouvelle chaîne s'il l'est déjà
+    
+    Les symboles renvoyés par l'API sont presque toujours déjà en
+    majuscules: isupper() évite alors la copie faite par upper().
+    """
+    return symbol if symbol.isascii() and symbol.isupper() else symbol.upper()
+
+
 class Stock:
     """
     Classe représentant une action boursière avec ses données principales
@@ -20,6 +30,17 @@ class Stock:
         last_update (datetime): Date et heure de la dernière mise à jour
     """
     
+    # Attributs fixes: pas de __dict__ par instance (moins de mémoire,
+    # accès plus rapide pour les portefeuilles de nombreuses actions)
+    __slots__ = ('symbol', 'name', 'current_price', 'opening_price',
+                 'highest_price', 'lowest_price', 'volume', 'last_update',
+                 '_variation', '_variation_value', '_variations_ready',
+                 '_last_update_iso')
+    
+    # Incrémenté à chaque update_price() de n'importe quelle action:
+    # permet aux Portfolio de savoir si leurs tableaux de prix sont à jour
+    _price_version = 0
+    
     def __init__(self, symbol: str, name: str):
         """
         Initialise une nouvelle instance de Stock
@@ -28,7 +49,7 @@ class Stock:
             symbol (str): Symbole boursier (ex: 'AAPL')
             name (str): Nom de l'entreprise (ex: 'Apple Inc.')
         """
-        self.symbol = symbol.upper()  # Toujours en majuscules
+        self.symbol = _norm_symbol(symbol)  # Toujours en majuscules
         self.name = name
         self.current_price: Optional[float] = None
         self.opening_price: Optional[float] = None
@@ -36,12 +57,19 @@ class Stock:
         self.lowest_price: Optional[float] = None
         self.volume: Optional[int] = None
         self.last_update: Optional[datetime] = None
+        # Variations mémorisées, recalculées après chaque update_price()
+        self._variation: Optional[float] = None
+        self._variation_value: Optional[float] = None
+        self._variations_ready = False
+        # last_update au format ISO (to_dict), remis en forme après chaque update_price()
+        self._last_update_iso: Optional[str] = None
     
     def update_price(self, new_price: float, 
                      opening: Optional[float] = None,
                      high: Optional[float] = None, 
                      low: Optional[float] = None,
-                     volume: Optional[int] = None):
+                     volume: Optional[int] = None,
+                     now: Optional[datetime] = None):
         """
         Met à jour les informations de prix de l'action
         
@@ -51,6 +79,9 @@ class Stock:
             high (float, optional): Prix le plus haut
             low (float, optional): Prix le plus bas
             volume (int, optional): Volume d'échanges
+            now (datetime, optional): Date de mise à jour; lors d'une mise à jour
+                                      groupée, l'appelant la lit une seule fois
+                                      pour toutes les actions (défaut: datetime.now())
         """
         self.current_price = new_price
         if opening is not None:
@@ -61,35 +92,50 @@ class Stock:
             self.lowest_price = low
         if volume is not None:
             self.volume = volume
-        self.last_update = datetime.now()
+        self.last_update = now or datetime.now()
+        self._variations_ready = False
+        self._last_update_iso = None
+        Stock._price_version += 1
     
     def get_variation(self) -> Optional[float]:
         """
         Calcule la variation en pourcentage depuis l'ouverture
         
+        Le résultat est mémorisé jusqu'au prochain update_price().
+        
         Returns:
             float: Variation en % (ex: 2.5 pour +2.5%), ou None si données manquantes
         """
-        if self.current_price is None or self.opening_price is None:
-            return None
-        
-        if self.opening_price == 0:  # Éviter division par zéro
-            return None
-        
-        variation = ((self.current_price - self.opening_price) / self.opening_price) * 100
-        return round(variation, 2)
+        if not self._variations_ready:
+            self._compute_variations()
+        return self._variation
     
     def get_variation_value(self) -> Optional[float]:
         """
         Calcule la variation en valeur absolue depuis l'ouverture
         
+        Le résultat est mémorisé jusqu'au prochain update_price().
+        
         Returns:
             float: Variation en $ (ex: 3.45 pour +$3.45), ou None si données manquantes
         """
-        if self.current_price is None or self.opening_price is None:
-            return None
+        if not self._variations_ready:
+            self._compute_variations()
+        return self._variation_value
+    
+    def _compute_variations(self):
+        """Calcule et mémorise les variations en % et en valeur absolue"""
+        self._variation = None
+        self._variation_value = None
+        
+        if self.current_price is not None and self.opening_price is not None:
+            self._variation_value = round(self.current_price - self.opening_price, 2)
+            
+            if self.opening_price != 0:  # Éviter division par zéro
+                variation = ((self.current_price - self.opening_price) / self.opening_price) * 100
+                self._variation = round(variation, 2)
         
-        return round(self.current_price - self.opening_price, 2)
+        self._variations_ready = True
     
     def to_dict(self) -> dict:
         """
@@ -107,17 +153,24 @@ class Stock:
             'highest_price': self.highest_price,
             'lowest_price': self.lowest_price,
             'volume': self.volume,
-            'last_update': self.last_update.isoformat() if self.last_update else None,
+            'last_update': self._last_update_isoformat(),
             'variation_percent': self.get_variation(),
             'variation_value': self.get_variation_value()
         }
     
+    def _last_update_isoformat(self) -> Optional[str]:
+        """last_update au format ISO, mémorisé jusqu'au prochain update_price()"""
+        if self._last_update_iso is None and self.last_update:
+            self._last_update_iso = self.last_update.isoformat()
+        return self._last_update_iso
+    
     def __str__(self) -> str:
         """
         Représentation textuelle de l'action (pour print())
         
         Returns:
-            str: Description de l'action
+            str: Description de l'action (reconstruite à chaque appel: le nom
+                 peut être modifié directement, sans update_price())
         """
         variation = self.get_variation()
         variation_str = f"{variation:+.2f}%" if variation is not None else "N/A"
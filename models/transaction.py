@@ -3,7 +3,13 @@ Classe Transaction - Représente une transaction d'achat ou de vente d'actions
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Tuple
+import numpy as np
+
+try:
+    from models.stock import _norm_symbol
+except ImportError:  # Fichier exécuté seul (python models/transaction.py)
+    from stock import _norm_symbol
 
 
 class TransactionType(Enum):
@@ -26,6 +32,10 @@ class Transaction:
         fees (float): Frais de transaction
     """
     
+    # Attributs fixes: pas de __dict__ par instance
+    __slots__ = ('transaction_id', 'stock_symbol', 'transaction_type', 'quantity',
+                 'price_per_share', 'transaction_date', 'fees', '_str', '_date_iso')
+    
     def __init__(self, 
                  stock_symbol: str,
                  transaction_type: TransactionType,
@@ -53,12 +63,15 @@ class Transaction:
             raise ValueError("Le prix par action doit être positif")
         
         self.transaction_id: Optional[int] = None  # Sera défini lors de l'insertion en BDD
-        self.stock_symbol = stock_symbol.upper()
+        # Pas de copie si le symbole est déjà en majuscules (cas de l'API)
+        self.stock_symbol = _norm_symbol(stock_symbol)
         self.transaction_type = transaction_type
         self.quantity = quantity
         self.price_per_share = price_per_share
         self.transaction_date = transaction_date or datetime.now()
         self.fees = fees
+        self._str: Optional[str] = None  # Texte de __str__, construit une seule fois
+        self._date_iso: Optional[str] = None  # Date ISO de to_dict, idem
     
     def get_total_amount(self) -> float:
         """
@@ -96,6 +109,9 @@ class Transaction:
         Returns:
             dict: Dictionnaire avec toutes les informations
         """
+        if self._date_iso is None:
+            self._date_iso = self.transaction_date.isoformat()
+        
         return {
             'transaction_id': self.transaction_id,
             'stock_symbol': self.stock_symbol,
@@ -104,7 +120,7 @@ class Transaction:
             'price_per_share': self.price_per_share,
             'total_amount': self.get_total_amount(),
             'fees': self.fees,
-            'transaction_date': self.transaction_date.isoformat(),
+            'transaction_date': self._date_iso,
             'net_amount': self.get_net_amount()
         }
     
@@ -113,15 +129,18 @@ class Transaction:
         Représentation textuelle de la transaction
         
         Returns:
-            str: Description de la transaction
+            str: Description de la transaction (une transaction ne change pas:
+                 le texte est mis en forme au premier appel puis réutilisé)
         """
-        action = "ACHAT" if self.is_buy() else "VENTE"
-        total = self.get_total_amount()
-        date_str = self.transaction_date.strftime("%Y-%m-%d %H:%M")
-        
-        return (f"{action} de {self.quantity} {self.stock_symbol} "
-                f"@ ${self.price_per_share:.2f} = ${total:.2f} "
-                f"({date_str})")
+        if self._str is None:
+            action = "ACHAT" if self.is_buy() else "VENTE"
+            total = self.get_total_amount()
+            date_str = self.transaction_date.strftime("%Y-%m-%d %H:%M")
+            
+            self._str = (f"{action} de {self.quantity} {self.stock_symbol} "
+                         f"@ ${self.price_per_share:.2f} = ${total:.2f} "
+                         f"({date_str})")
+        return self._str
     
     def __repr__(self) -> str:
         """
@@ -136,6 +155,89 @@ class Transaction:
                 f"price=${self.price_per_share})")
 
 
+class TransactionLog:
+    """
+    Journal de transactions, avec une vue "structure de tableaux" pour les calculs
+    
+    Les montants de toutes les transactions sont calculés en une seule
+    expression NumPy (net = sens * (quantité * prix + frais)) au lieu d'un
+    appel à get_net_amount() par transaction.
+    
+    La liste est privée: append() est le seul moyen de modifier le journal,
+    et chaque ajout incrémente un numéro de version qui invalide les tableaux.
+    
+    Attributes:
+        transactions (Tuple[Transaction, ...]): Transactions, dans l'ordre d'ajout
+                                                (copie en lecture seule)
+    """
+    
+    def __init__(self):
+        """Initialise un journal vide"""
+        self._transactions: List[Transaction] = []
+        self._version = 0
+        
+        # Tableaux parallèles à self._transactions: quantités, prix, frais et
+        # sens (-1 pour un achat, +1 pour une vente), reconstruits après un ajout
+        self._qty = np.empty(0, dtype=np.int64)
+        self._price = np.empty(0)
+        self._fees = np.empty(0)
+        self._side = np.empty(0, dtype=np.int8)
+        self._arrays_version = 0
+    
+    @property
+    def transactions(self) -> Tuple[Transaction, ...]:
+        """Transactions du journal, dans l'ordre d'ajout (lecture seule)"""
+        return tuple(self._transactions)
+    
+    def append(self, transaction: Transaction):
+        """
+        Ajoute une transaction au journal
+        
+        Args:
+            transaction (Transaction): La transaction à ajouter
+        """
+        self._transactions.append(transaction)
+        self._version += 1
+    
+    def _arrays(self):
+        """Tableaux (quantités, prix, frais, sens), reconstruits seulement après un ajout"""
+        if self._arrays_version != self._version:
+            txs = self._transactions
+            self._qty = np.array([tx.quantity for tx in txs], dtype=np.int64)
+            self._price = np.array([tx.price_per_share for tx in txs], dtype=np.float64)
+            self._fees = np.array([tx.fees for tx in txs], dtype=np.float64)
+            self._side = np.array([-1 if tx.is_buy() else 1 for tx in txs], dtype=np.int8)
+            self._arrays_version = self._version
+        return self._qty, self._price, self._fees, self._side
+    
+    def net_amounts(self) -> np.ndarray:
+        """
+        Montants nets de toutes les transactions (comme get_net_amount())
+        
+        Returns:
+            ndarray: Montants nets (négatifs pour les achats), dans l'ordre d'ajout
+        """
+        qty, price, fees, side = self._arrays()
+        return side * (qty * price + fees)
+    
+    def total_cashflow(self) -> float:
+        """
+        Flux de trésorerie total du journal (ventes - achats - frais)
+        
+        Returns:
+            float: Somme des montants nets
+        """
+        # Import local: transaction.py reste exécutable seul (exemple ci-dessous)
+        from models._kernels import ledger_total
+        
+        # Un seul parcours compilé, sans tableau intermédiaire des montants
+        return float(ledger_total(*self._arrays()))
+    
+    def __len__(self) -> int:
+        """Nombre de transactions du journal"""
+        return len(self._transactions)
+
+
 # Exemple d'utilisation (pour tester la classe)
 if __name__ == "__main__":
     print("=== Tests de la classe Transaction ===\n")
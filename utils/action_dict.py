@@ -2,9 +2,10 @@
 Dictionnaire des actions populaires
 Permet la recherche par nom ou symbole
 """
+from types import MappingProxyType
 
-# Dictionnaire: Nom -> Symbole
-ACTIONS_DICT = {
+# Dictionnaire: Nom -> Symbole (lecture seule)
+ACTIONS_DICT = MappingProxyType({
     # Tech Giants
     "Apple": "AAPL",
     "Microsoft": "MSFT",
@@ -98,15 +99,12 @@ ACTIONS_DICT = {
     "Hermès": "HESAY",
     "Kering": "PPRUY",
     
-    # French CAC40
+    # French CAC40 (TotalEnergies, LVMH et Airbus: voir plus haut)
     "Total": "TTE",
-    "TotalEnergies": "TTE",
-    "LVMH": "LVMUY",
     "Sanofi": "SNY",
     "L'Oréal": "LRLCY",
     "Air Liquide": "AIQUY",
     "BNP Paribas": "BNPQY",
-    "Airbus": "EADSY",
     "Danone": "DANOY",
     "Michelin": "MGDDY",
     "Renault": "RNLSY",
@@ -114,10 +112,16 @@ ACTIONS_DICT = {
     "Carrefour": "CRRFY",
     "Orange": "ORAN",
     "Veolia": "VEOEY",
-}
+})
 
 # Liste pour l'autocomplétion (triée)
-ACTIONS_LISTE = sorted([nom for nom in ACTIONS_DICT.keys() if ACTIONS_DICT[nom] is not None])
+ACTIONS_LISTE = tuple(sorted(nom for nom, symbole in ACTIONS_DICT.items() if symbole is not None))
+
+# Correspondance Nom -> Symbole des actions de la liste (accès direct, sans recherche)
+NAME_TO_SYMBOL = {nom: ACTIONS_DICT[nom] for nom in ACTIONS_LISTE}
+
+# Index nom en minuscules -> symbole, construit une seule fois (recherche en O(1))
+_LOWER_INDEX = {nom.lower(): symbole for nom, symbole in ACTIONS_DICT.items()}
 
 # Fonction de recherche
 def rechercher_action(nom_ou_symbole: str) -> str:
@@ -133,9 +137,9 @@ def rechercher_action(nom_ou_symbole: str) -> str:
     recherche = nom_ou_symbole.strip()
     
     # D'abord chercher par nom (insensible à la casse)
-    for nom, symbole in ACTIONS_DICT.items():
-        if nom.lower() == recherche.lower():
-            return symbole
+    cle = recherche.lower()
+    if cle in _LOWER_INDEX:
+        return _LOWER_INDEX[cle]
     
     # Sinon, considérer que c'est déjà un symbole
     return recherche.upper()
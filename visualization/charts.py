@@ -1,11 +1,44 @@
 """
 Module ChartGenerator - Generation de graphiques
 """
+import logging
+import os
+import threading
+import matplotlib
+
+# Graphiques sauvegardes en PNG: backend Agg (sans interface graphique),
+# sauf si un autre backend est demande par la variable MPLBACKEND
+if 'MPLBACKEND' not in os.environ:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from io import BytesIO
 from typing import Optional
+import numpy as np
 import pandas as pd
 
+# Simplification des tracés: moins de segments a rasteriser pour les longues series
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+# Format des dates sur l'axe X de tous les graphiques
+DATE_FORMAT = '%Y-%m-%d'
+
+# Dossier des graphiques sauvegardes par save_chart (cree par main.py / app.py)
+EXPORT_DIR = os.path.join('data', 'exports')
+
+# Compression zlib des PNG (matplotlib les encode avec Pillow): le niveau 1
+# est plusieurs fois plus rapide que le niveau 6 par defaut, pour des
+# fichiers a peine plus gros (aplats de couleur des graphiques)
+PNG_COMPRESS_LEVEL = 1
+
+# Formats vectoriels: les courbes y restent vectorielles (voir save_chart)
+VECTOR_EXTENSIONS = ('.svg', '.pdf', '.eps')
+
+logger = logging.getLogger(__name__)
+
 
 class ChartGenerator:
     """
@@ -21,7 +54,46 @@ class ChartGenerator:
         """Initialise le ChartGenerator"""
         # Configuration du style
         plt.style.use('default')
-        print(" ChartGenerator initialise")
+        # Figures reutilisees d'un graphique a l'autre (une par taille et par thread)
+        self._local = threading.local()
+        logger.debug("ChartGenerator initialise")
+    
+    def _get_axes(self, figsize: tuple):
+        """
+        Renvoie une figure videe de la taille demandee, creee une seule fois
+        
+        La figure est recreee si elle a ete fermee (plt.close, close_all).
+        Chaque thread a ses propres figures (sessions Streamlit simultanees).
+        
+        Args:
+            figsize (tuple): Taille de la figure en pouces
+        
+        Returns:
+            tuple: (Figure, Axes)
+        """
+        figures = getattr(self._local, 'figures', None)
+        if figures is None:
+            figures = self._local.figures = {}
+        
+        fig = figures.get(figsize)
+        if fig is None or not plt.fignum_exists(fig.number):
+            fig, ax = plt.subplots(figsize=figsize)
+            figures[figsize] = fig
+        else:
+            ax = fig.axes[0]
+            ax.clear()
+        return fig, ax
+    
+    @staticmethod
+    def _style_date_axis(ax):
+        """
+        Dates au format AAAA-MM-JJ, inclinees a 45 degres, sur l'axe X
+        
+        Un formateur par appel: matplotlib lie chaque formateur a un seul axe,
+        et ax.clear() (figures reutilisees) remet le formateur par defaut.
+        """
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(DATE_FORMAT))
+        ax.tick_params(axis='x', labelrotation=45)
     
     def create_price_chart(self, data: pd.DataFrame, title: str = "Prix de l'action") -> plt.Figure:
         """
@@ -34,13 +106,14 @@ class ChartGenerator:
         Returns:
             Figure: Graphique matplotlib
         """
-        print(f"  Creation du graphique: {title}")
+        logger.debug("Creation du graphique: %s", title)
         
         # Creer la figure avec taille TRES reduite pour PDF
-        fig, ax = plt.subplots(figsize=(8, 3))
+        fig, ax = self._get_axes((8, 3))
         
         # Tracer la ligne des prix
-        ax.plot(data['Date'], data['Close'], color='blue', linewidth=2, label='Prix')
+        ax.plot(data['Date'], data['Close'], color='blue', linewidth=2, label='Prix',
+                rasterized=True)
         
         # Personnalisation
         ax.set_title(title, fontsize=16, fontweight='bold')
@@ -50,11 +123,10 @@ class ChartGenerator:
         ax.grid(True, alpha=0.3)
         
         # Formater les dates sur l'axe X
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.xticks(rotation=45)
+        self._style_date_axis(ax)
         
-        plt.tight_layout()
-        print("   Graphique cree")
+        fig.tight_layout()
+        logger.debug("Graphique cree")
         
         return fig
     
@@ -73,17 +145,19 @@ class ChartGenerator:
         Returns:
             Figure: Graphique matplotlib
         """
-        print(f"  Creation du graphique: {title}")
+        logger.debug("Creation du graphique: %s", title)
         
         # Creer la figure
-        fig, ax = plt.subplots(figsize=(8, 3))
+        fig, ax = self._get_axes((8, 3))
         
         # Tracer le prix
-        ax.plot(data['Date'], data['Close'], color='blue', linewidth=2, label='Prix')
+        ax.plot(data['Date'], data['Close'], color='blue', linewidth=2, label='Prix',
+                rasterized=True)
         
         # Tracer la moyenne mobile
         ax.plot(data['Date'], ma, color='red', linewidth=2, 
-                linestyle='--', label=f'Moyenne Mobile ({window}j)')
+                linestyle='--', label=f'Moyenne Mobile ({window}j)',
+                rasterized=True)
         
         # Personnalisation
         ax.set_title(title, fontsize=16, fontweight='bold')
@@ -92,12 +166,11 @@ class ChartGenerator:
         ax.legend()
         ax.grid(True, alpha=0.3)
         
-        # Formater les dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.xticks(rotation=45)
+        # Formater les dates sur l'axe X
+        self._style_date_axis(ax)
         
-        plt.tight_layout()
-        print("   Graphique cree")
+        fig.tight_layout()
+        logger.debug("Graphique cree")
         
         return fig
     
@@ -113,24 +186,37 @@ class ChartGenerator:
         Returns:
             Figure: Graphique matplotlib
         """
-        print(f"  Creation du graphique: {title}")
+        logger.debug("Creation du graphique: %s", title)
         
         # Creer la figure
-        fig, ax = plt.subplots(figsize=(8, 3))
-        
-        # Couleurs pour chaque action
-        colors = ['blue', 'green', 'red', 'orange', 'purple']
-        
-        # Tracer chaque action
-        for i, (symbol, data) in enumerate(stocks_data.items()):
-            color = colors[i % len(colors)]
-            
-            # Normaliser les prix pour comparaison (base 100)
-            first_price = data['Close'].iloc[0]
-            normalized = (data['Close'] / first_price) * 100
-            
-            ax.plot(data['Date'], normalized, color=color, 
-                   linewidth=2, label=symbol)
+        fig, ax = self._get_axes((8, 3))
+        
+        # Colonnes extraites une seule fois en tableaux NumPy
+        series = [(symbol, data['Date'].to_numpy(), data['Close'].to_numpy(dtype=np.float64))
+                  for symbol, data in stocks_data.items()]
+        dates = series[0][1] if series else None
+        same_dates = all(
+            len(x) == len(dates) and np.array_equal(x, dates)
+            for _, x, _ in series
+        )
+        
+        # Couleurs: cycle par defaut de matplotlib (axes.prop_cycle, 10 couleurs),
+        # repris depuis le debut a chaque graphique (ax.clear)
+        if series and same_dates:
+            # Memes dates pour toutes les actions: normalisation (base 100) en
+            # une seule operation sur le tableau jours x actions, un seul ax.plot
+            closes = np.column_stack([y for _, _, y in series])
+            normalized = closes / closes[0] * 100.0
+            lines = ax.plot(dates, normalized, linewidth=2, rasterized=True)
+            for line, (symbol, _, _) in zip(lines, series):
+                line.set_label(symbol)
+        else:
+            # Tracer chaque action
+            for symbol, x, y in series:
+                # Normaliser les prix pour comparaison (base 100)
+                normalized = y * (100.0 / y[0])
+                
+                ax.plot(x, normalized, linewidth=2, label=symbol, rasterized=True)
         
         # Personnalisation
         ax.set_title(title, fontsize=16, fontweight='bold')
@@ -142,12 +228,11 @@ class ChartGenerator:
         # Ligne horizontale a 100
         ax.axhline(y=100, color='gray', linestyle=':', alpha=0.5)
         
-        # Formater les dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.xticks(rotation=45)
+        # Formater les dates sur l'axe X
+        self._style_date_axis(ax)
         
-        plt.tight_layout()
-        print("   Graphique cree")
+        fig.tight_layout()
+        logger.debug("Graphique cree")
         
         return fig
     
@@ -163,13 +248,20 @@ class ChartGenerator:
         Returns:
             Figure: Graphique matplotlib
         """
-        print(f"  Creation du graphique: {title}")
+        logger.debug("Creation du graphique: %s", title)
         
         # Creer la figure
-        fig, ax = plt.subplots(figsize=(8, 2.5))
+        fig, ax = self._get_axes((8, 2.5))
+        
+        # Longues periodes: volumes cumules par semaine (7 fois moins de barres a dessiner)
+        if len(data) > 250:
+            weekly = data.set_index('Date')['Volume'].resample('W').sum()
+            dates, volumes, width = weekly.index, weekly.to_numpy(), 5
+        else:
+            dates, volumes, width = data['Date'], data['Volume'], 0.8
         
         # Graphique en barres pour les volumes
-        ax.bar(data['Date'], data['Volume'], color='lightblue', 
+        ax.bar(dates, volumes, width=width, color='lightblue', 
                alpha=0.7, label='Volume')
         
         # Personnalisation
@@ -179,36 +271,104 @@ class ChartGenerator:
         ax.legend()
         ax.grid(True, alpha=0.3, axis='y')
         
-        # Formater les dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.xticks(rotation=45)
+        # Formater les dates sur l'axe X
+        self._style_date_axis(ax)
         
-        plt.tight_layout()
-        print("   Graphique cree")
+        fig.tight_layout()
+        logger.debug("Graphique cree")
         
         return fig
     
-    def save_chart(self, fig: plt.Figure, filename: str):
+    def save_chart(self, fig: plt.Figure, filename: str, dpi: int = 120) -> str:
         """
         Sauvegarde un graphique
         
+        Le format suit l'extension du fichier: '.svg' (ou '.pdf', '.eps')
+        donne une image vectorielle, nette a toute taille. Les courbes sont
+        tracees avec rasterized=True (PNG plus rapides): cette option est
+        levee le temps de l'enregistrement vectoriel, puis retablie.
+        
+        Pas de bbox_inches='tight' (voir save_chart_buf): un seul rendu
+        par fichier.
+        
+        Args:
+            fig (Figure): Figure a sauvegarder
+            filename (str): Nom du fichier (ex: 'mon_graphique.png' ou 'mon_graphique.svg')
+            dpi (int): Resolution des PNG (defaut: 120, soit 960x360 pixels pour
+                       une figure 8x3; 300 pour une impression)
+        
+        Returns:
+            str: Chemin du fichier dans EXPORT_DIR
+        """
+        filepath = os.path.join(EXPORT_DIR, filename)
+        extension = os.path.splitext(filename)[1].lower()
+        if extension == '.png':
+            fig.savefig(filepath, dpi=dpi,
+                        pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        elif extension in VECTOR_EXTENSIONS:
+            rasterized = [artist for ax in fig.axes for artist in ax.get_children()
+                          if artist.get_rasterized()]
+            for artist in rasterized:
+                artist.set_rasterized(False)
+            try:
+                fig.savefig(filepath, dpi=dpi)
+            finally:
+                for artist in rasterized:
+                    artist.set_rasterized(True)
+        else:
+            fig.savefig(filepath, dpi=dpi)
+        logger.debug("Graphique sauvegarde: %s", filepath)
+        return filepath
+    
+    def save_chart_buf(self, fig: plt.Figure, dpi: int = 100) -> BytesIO:
+        """
+        Sauvegarde un graphique en PNG dans un tampon memoire
+        
+        Evite l'aller-retour par data/exports quand l'image est
+        directement inseree dans un PDF ou affichee par Streamlit.
+        
+        Pas de bbox_inches='tight': les figures ont deja leur mise en page
+        (tight_layout), et le recadrage imposerait un rendu supplementaire
+        pour mesurer la zone dessinee.
+        
         Args:
             fig (Figure): Figure a sauvegarder
-            filename (str): Nom du fichier (ex: 'mon_graphique.png')
+            dpi (int): Resolution (defaut: 100 pour l'ecran, 80 suffit pour un PDF)
+        
+        Returns:
+            BytesIO: Image PNG, positionnee au debut
         """
-        filepath = f"data/exports/{filename}"
-        fig.savefig(filepath, dpi=300, bbox_inches='tight')
-        print(f"   Graphique sauvegarde: {filepath}")
+        buf = BytesIO()
+        fig.savefig(buf, format='png', dpi=dpi,
+                    pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+        buf.seek(0)
+        return buf
     
     def show_chart(self, fig: plt.Figure):
         """
         Affiche un graphique a l'ecran
         
+        Necessite un backend interactif (ex: MPLBACKEND=TkAgg), Agg par defaut.
+        
         Args:
             fig (Figure): Figure a afficher
         """
         plt.show()
     
+    def close(self, *figs: plt.Figure):
+        """
+        Ferme seulement les figures donnees
+        
+        A preferer a close_all() quand le ChartGenerator est partage
+        (Streamlit): les figures des autres sessions restent ouvertes.
+        Une figure fermee est recreee par le prochain graphique de sa taille.
+        
+        Args:
+            *figs (Figure): Figures a fermer
+        """
+        for fig in figs:
+            plt.close(fig)
+    
     def close_all(self):
         """Ferme tous les graphiques"""
         plt.close('all')
\ No newline at end of file